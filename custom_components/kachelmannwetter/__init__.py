@@ -1,44 +1,69 @@
 """KachelmannWetter integration for Home Assistant (skeleton)."""
 from __future__ import annotations
 
-from homeassistant.config_entries import ConfigEntry, ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN, PLATFORMS
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    hass.data.setdefault(DOMAIN, {})
 
-    # Coordinator created in coordinator.py; import lazily to keep startup fast
-    from .coordinator import KachelmannDataUpdateCoordinator
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    from .backfill import async_register_services
 
-    api_key = entry.data.get("api_key")
-    latitude = entry.data.get("latitude")
-    longitude = entry.data.get("longitude")
+    async_register_services(hass)
+    return True
 
-    # Respect configured update interval if provided in options
-    from .const import OPTION_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
 
-    update_interval = entry.options.get(OPTION_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
-    coordinator = KachelmannDataUpdateCoordinator(hass, api_key, latitude, longitude, update_interval_seconds=update_interval)
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        # Map invalid auth to AuthFailed so Home Assistant can trigger reauth
-        from .exceptions import InvalidAuth
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    hass.data.setdefault(DOMAIN, {})
 
-        if isinstance(err, InvalidAuth):
-            raise ConfigEntryAuthFailed from err
-        raise ConfigEntryNotReady from err
+    # Coordinators are created per location by the scheduler; import lazily to
+    # keep startup fast
+    from .scheduler import LocationScheduler
+
+    scheduler = LocationScheduler(hass, entry)
+    try:
+        await scheduler.async_setup()
+    except Exception:
+        await scheduler.async_shutdown()
+        raise
 
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    hass.data[DOMAIN][entry.entry_id] = scheduler
+    entry.async_on_unload(scheduler.async_shutdown)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options.
+
+    Added or removed locations are applied in place; any other option
+    reloads the entry.
+    """
+    from .scheduler import entry_locations, entry_settings
+
+    scheduler = hass.data[DOMAIN][entry.entry_id]
+    if entry_settings(entry) == scheduler.settings:
+        await scheduler.async_update_locations(entry_locations(entry))
+    else:
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    from .coordinator import location_prefix
+    from .scheduler import async_remove_location_data, entry_locations
+
+    for location_id in entry_locations(entry):
+        await async_remove_location_data(hass, location_prefix(entry.entry_id, location_id or None))
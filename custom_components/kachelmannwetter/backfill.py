@@ -0,0 +1,166 @@
+"""Backfill of observation history into recorder long-term statistics."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from logging import Logger, getLogger
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import BACKFILL_BATCH, BACKFILL_PAGE, DOMAIN, SERVICE_BACKFILL_STATISTICS, STORAGE_VERSION
+from .exceptions import KachelmannError
+from .helpers import OBSERVATION_FIELDS, hourly_statistics
+
+_LOGGER: Logger = getLogger(__package__)
+
+ATTR_ENTRY_ID = "entry_id"
+ATTR_START = "start"
+ATTR_END = "end"
+
+SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Required(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+    }
+)
+
+
+def _hour(moment: datetime) -> datetime:
+    return dt_util.as_utc(moment).replace(minute=0, second=0, microsecond=0)
+
+
+def _batches(start: datetime, end: datetime, backwards: bool = False) -> Iterator[tuple[datetime, datetime]]:
+    """Split [start, end) into batches, newest first when going backwards."""
+    size = timedelta(hours=BACKFILL_PAGE * BACKFILL_BATCH)
+    if backwards:
+        while end > start:
+            yield max(start, end - size), end
+            end -= size
+    else:
+        while start < end:
+            yield start, min(end, start + size)
+            start += size
+
+
+def _missing(start: datetime, end: datetime, covered: tuple[datetime, datetime] | None) -> list[tuple[datetime, datetime]]:
+    """Batches of [start, end) not yet imported, each adjacent to the covered range.
+
+    The gap before the covered range is walked backwards and the gap after it
+    forwards, so the covered range stays contiguous and can be checkpointed
+    after every batch. A requested range that does not touch the covered one
+    is extended to it: the hours in between are fetched too rather than
+    recorded as covered without being imported.
+    """
+    if covered is None:
+        return list(_batches(start, end))
+    covered_start, covered_end = covered
+    batches = []
+    if start < covered_start:
+        batches.extend(_batches(start, covered_start, backwards=True))
+    if end > covered_end:
+        batches.extend(_batches(covered_end, end))
+    return batches
+
+
+async def async_backfill(hass: HomeAssistant, coordinator, start: datetime, end: datetime) -> int:
+    """Import hourly statistics of one location for [start, end); returns the number of hours fetched."""
+    from homeassistant.components.recorder.models import StatisticMetaData
+    from homeassistant.components.recorder.statistics import async_import_statistics
+
+    from .sensor import WEATHER_SENSORS
+
+    # Hours that have not passed yet have no observations to import, and must
+    # not be checkpointed as covered
+    start, end = _hour(start), min(_hour(end), _hour(dt_util.utcnow()))
+    if start >= end:
+        return 0
+    registry = er.async_get(hass)
+    units = {description.key: description.native_unit_of_measurement for description in WEATHER_SENSORS}
+    prefix = coordinator.unique_prefix
+    statistic_ids = {
+        key: entity_id
+        for key in OBSERVATION_FIELDS
+        if (entity_id := registry.async_get_entity_id("sensor", DOMAIN, f"{prefix}_{key}")) is not None
+    }
+    if not statistic_ids:
+        raise HomeAssistantError(f"No KachelmannWetter sensors to backfill for {prefix}")
+
+    store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{prefix}.backfill")
+    stored = await store.async_load() or {}
+    covered_start = dt_util.parse_datetime(stored.get("start") or "")
+    covered_end = dt_util.parse_datetime(stored.get("end") or "")
+    covered = (covered_start, covered_end) if covered_start and covered_end else None
+
+    fetched = 0
+    for batch_start, batch_end in _missing(start, end, covered):
+        entries = []
+        page_start = batch_start
+        while page_start < batch_end:
+            page_end = min(batch_end, page_start + timedelta(hours=BACKFILL_PAGE))
+            body = await coordinator.client.async_get_observations(
+                coordinator.latitude, coordinator.longitude, page_start, page_end
+            )
+            entries.extend(body.get("data", []))
+            page_start = page_end
+
+        # One batched import per sensor for the whole batch
+        for key, statistic_id in statistic_ids.items():
+            rows = [
+                row
+                for row in hourly_statistics(entries, OBSERVATION_FIELDS[key])
+                if batch_start <= row["start"] < batch_end
+            ]
+            if not rows:
+                continue
+            metadata = StatisticMetaData(
+                has_mean=True,
+                has_sum=False,
+                name=None,
+                source="recorder",
+                statistic_id=statistic_id,
+                unit_of_measurement=units.get(key),
+            )
+            async_import_statistics(hass, metadata, rows)
+
+        covered = (
+            (min(covered[0], batch_start), max(covered[1], batch_end)) if covered else (batch_start, batch_end)
+        )
+        await store.async_save({"start": covered[0].isoformat(), "end": covered[1].isoformat()})
+        fetched += int((batch_end - batch_start).total_seconds() // 3600)
+        _LOGGER.debug("Backfilled %s - %s for %s", batch_start, batch_end, prefix)
+    return fetched
+
+
+async def _async_handle_backfill(hass: HomeAssistant, call: ServiceCall) -> None:
+    start = call.data[ATTR_START]
+    end = call.data.get(ATTR_END) or dt_util.utcnow()
+    entry_ids = [call.data[ATTR_ENTRY_ID]] if ATTR_ENTRY_ID in call.data else [
+        entry.entry_id for entry in hass.config_entries.async_entries(DOMAIN)
+    ]
+    for entry_id in entry_ids:
+        scheduler = hass.data.get(DOMAIN, {}).get(entry_id)
+        if scheduler is None:
+            raise HomeAssistantError(f"KachelmannWetter entry {entry_id} is not loaded")
+        for coordinator in list(scheduler.coordinators.values()):
+            if coordinator.data is None:
+                # no sensors yet; their first refresh has not succeeded
+                continue
+            try:
+                hours = await async_backfill(hass, coordinator, start, end)
+            except KachelmannError as err:
+                raise HomeAssistantError(f"Backfill for entry {entry_id} stopped: {err}") from err
+            _LOGGER.info("Backfilled %s hours of statistics for %s", hours, coordinator.display_name)
+
+
+def async_register_services(hass: HomeAssistant) -> None:
+    async def handle_backfill(call: ServiceCall) -> None:
+        await _async_handle_backfill(hass, call)
+
+    hass.services.async_register(DOMAIN, SERVICE_BACKFILL_STATISTICS, handle_backfill, schema=SERVICE_SCHEMA)
@@ -1,28 +1,174 @@
 """Thin async client for KachelmannWetter API."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from datetime import datetime
 from typing import Any
+import asyncio
+import json
 import logging
+import re
+import time
 
-from aiohttp import ClientResponseError
+from aiohttp import ClientResponseError, ClientTimeout
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .exceptions import InvalidAuth, RateLimitError
+from .const import API_BASE, DOMAIN, GRID_DECIMALS, REQUEST_RETRIES, REQUEST_TIMEOUT
+from .exceptions import ApiUnavailableError, InvalidAuth, RateLimitError
+from .helpers import project_current, project_forecast, project_hourly, project_observations, project_trend
+from .metrics import ClientMetrics
+from .ratelimit import RateLimiter, get_rate_limiter
+from .recording import HttpRecorder, HttpReplay
+from .resilience import CircuitBreaker, backoff_delay, is_transient
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    json_loads = json.loads
 
 _LOGGER = logging.getLogger(__name__)
 
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+DATA_CLIENTS = "clients"
+
+# Backfilled observation pages are requested once; caching them would only
+# keep every page of a long backfill in memory
+_UNCACHED_ENDPOINTS = frozenset({"observations"})
+
+
+def snap_to_grid(latitude: float, longitude: float) -> tuple[float, float]:
+    """Round a location to the ~1 km grid shared by nearby locations."""
+    return round(latitude, GRID_DECIMALS), round(longitude, GRID_DECIMALS)
+
+
+def _cache_expiry(headers, now: float) -> float | None:
+    """Return the monotonic time until which a response may be reused, if any."""
+    cache_control = headers.get("Cache-Control", "")
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return None
+    match = _MAX_AGE_RE.search(cache_control)
+    if match is None:
+        return None
+    return now + int(match.group(1))
+
+
+class _CacheEntry:
+    """Parsed response body together with its HTTP validators."""
+
+    __slots__ = ("etag", "last_modified", "body", "expires")
+
+    def __init__(self, etag: str | None, last_modified: str | None, body: dict[str, Any], expires: float | None) -> None:
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = body
+        self.expires = expires
+
 
 class KachelmannClient:
-    def __init__(self, hass, api_key: str) -> None:
+    def __init__(
+        self,
+        hass,
+        api_key: str,
+        rate_limiter: RateLimiter | None = None,
+        base_url: str = API_BASE,
+        replay: HttpReplay | None = None,
+    ) -> None:
         self._hass = hass
+        self.base_url = base_url
         self._session = async_get_clientsession(hass)
         self._api_key = api_key
+        self._rate_limiter = rate_limiter
+        # Conditional GET cache keyed by URL; unchanged responses return the same body object
+        self._cache: dict[str, _CacheEntry] = {}
+        # Requests currently on the wire; concurrent callers share the result
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.metrics = ClientMetrics()
+        self.circuit_breakers: dict[str, CircuitBreaker] = {}
+        # Serve recorded responses instead of calling the API
+        self.replay = replay
+        # Recorders of the entries recording responses, by entry id; each gets
+        # every response of this client, as it is shared by those entries
+        self.recorders: dict[str, HttpRecorder] = {}
         _LOGGER.debug("KachelmannClient initialized with api_key_provided=%s", bool(api_key))
 
-    async def _get(self, url: str) -> dict[str, Any]:
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        return self._rate_limiter
+
+    async def _get(
+        self, url: str, endpoint: str = "other", project: Callable[[Any], dict[str, Any]] | None = None
+    ) -> dict[str, Any]:
+        """GET ``url`` and return its decoded body, reduced by ``project`` if given."""
+        task = self._inflight.get(url)
+        if task is None:
+            task = self._inflight[url] = asyncio.create_task(self._fetch(url, endpoint, project))
+            task.add_done_callback(lambda _task: self._inflight.pop(url, None))
+        else:
+            self.metrics.coalesced += 1
+            _LOGGER.debug("Joining in-flight request for %s", url)
+        # A cancelled caller must not cancel the request for everybody else
+        return await asyncio.shield(task)
+
+    async def _fetch(self, url: str, endpoint: str, project: Callable[[Any], dict[str, Any]] | None) -> dict[str, Any]:
+        cached = self._cache.get(url)
+        now = time.monotonic()
+        if cached is not None and cached.expires is not None and now < cached.expires:
+            self.metrics.cache_hits += 1
+            _LOGGER.debug("Serving %s from cache (fresh for %.0fs)", url, cached.expires - now)
+            return cached.body
+
+        breaker = self.circuit_breakers.get(endpoint)
+        if breaker is None:
+            breaker = self.circuit_breakers[endpoint] = CircuitBreaker()
+        if not breaker.allow():
+            raise ApiUnavailableError(f"Kachelmann API {endpoint} endpoint unavailable", retry_after=breaker.retry_after)
+
+        try:
+            attempt = 0
+            while True:
+                try:
+                    body = await self._request(url, endpoint, project, cached)
+                except Exception as err:
+                    if not is_transient(err):
+                        raise
+                    if attempt >= REQUEST_RETRIES:
+                        breaker.record_failure()
+                        raise
+                    delay = backoff_delay(attempt)
+                    attempt += 1
+                    _LOGGER.debug("Transient error for %s (%r), retry %s in %.1fs", url, err, attempt, delay)
+                    await asyncio.sleep(delay)
+                    continue
+                breaker.record_success()
+                return body
+        finally:
+            # No-op unless this was a trial request that ended without a verdict
+            breaker.release()
+
+    async def _request(
+        self, url: str, endpoint: str, project: Callable[[Any], dict[str, Any]] | None, cached: _CacheEntry | None
+    ) -> dict[str, Any]:
         headers = {"X-API-Key": self._api_key}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        if self._rate_limiter is not None:
+            await self._rate_limiter.async_acquire()
         _LOGGER.debug("HTTP GET %s (api_key_provided=%s)", url, bool(self._api_key))
-        resp = await self._session.get(url, headers=headers)
+        started = now = time.monotonic()
+        resp = await self._send(url, headers, started)
+        if self._rate_limiter is not None:
+            self._rate_limiter.update_from_headers(resp.headers)
+        # Each response is recorded once: here if no body is read, else after reading it
+        if resp.status >= 400 or (resp.status == 304 and cached is not None):
+            self.metrics.record_response(endpoint, resp.status, time.monotonic() - started)
+        if resp.status == 304 and cached is not None:
+            _LOGGER.debug("Not modified: %s", url)
+            cached.expires = _cache_expiry(resp.headers, now)
+            return cached.body
         # Handle common status codes explicitly
         if resp.status == 401:
             _LOGGER.error("Received 401 Unauthorized from Kachelmann API for url %s", url)
@@ -40,18 +186,72 @@ class KachelmannClient:
                     retry_after = int(resp.headers.get("x-ratelimit-retry-after"))
                 except Exception:
                     pass
+            if self._rate_limiter is not None:
+                self._rate_limiter.block(retry_after)
             raise RateLimitError("Rate limit exceeded", retry_after=retry_after)
         _LOGGER.debug("Response status %s for %s", resp.status, url)
         resp.raise_for_status()
-        body = await resp.json()
-        _LOGGER.debug("Response JSON for %s: %s", url, {k: body.get(k) for k in list(body)[:5]})
+        # Decode the raw bytes once and keep only the projected fields
+        raw = await resp.read()
+        self.metrics.record_response(endpoint, resp.status, time.monotonic() - started, len(raw))
+        body = json_loads(raw)
+        del raw
+        if project is not None:
+            body = project(body)
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        expires = _cache_expiry(resp.headers, now)
+        if endpoint not in _UNCACHED_ENDPOINTS and (etag or last_modified or expires is not None):
+            self._cache[url] = _CacheEntry(etag, last_modified, body, expires)
+        else:
+            self._cache.pop(url, None)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Response JSON for %s: %s", url, {k: body.get(k) for k in list(body)[:5]})
         return body
 
+    async def _send(self, url: str, headers: dict[str, str], started: float):
+        """Send the GET, or answer it from the replay; records the response if recording."""
+        path = url.removeprefix(self.base_url)
+        if self.replay is not None:
+            return await self.replay.async_response(url, path)
+        resp = await self._session.get(url, headers=headers, timeout=ClientTimeout(total=REQUEST_TIMEOUT))
+        for recorder in list(self.recorders.values()):
+            # The first recorder reads the body, the others get its replayable copy
+            resp = await recorder.async_record(url, path, resp, started)
+        return resp
+
     async def async_get_current(self, latitude: float, longitude: float) -> dict[str, Any]:
-        url = f"https://api.kachelmannwetter.com/v02/current/{latitude}/{longitude}"
-        return await self._get(url)
+        url = f"{self.base_url}/current/{latitude}/{longitude}"
+        return await self._get(url, "current", project_current)
+
+    async def async_get_observations(
+        self, latitude: float, longitude: float, start: datetime, end: datetime
+    ) -> dict[str, Any]:
+        """Observation history between ``start`` and ``end`` (UTC)."""
+        url = f"{self.base_url}/observations/{latitude}/{longitude}/{start:%Y-%m-%dT%H:%MZ}/{end:%Y-%m-%dT%H:%MZ}"
+        return await self._get(url, "observations", project_observations)
+
+    async def async_get_trend(self, latitude: float, longitude: float) -> dict[str, Any]:
+        url = f"{self.base_url}/forecast/{latitude}/{longitude}/trend14days"
+        return await self._get(url, "trend", project_trend)
 
     async def async_get_forecast(self, latitude: float, longitude: float) -> dict[str, Any]:
-        #url = f"https://api.kachelmannwetter.com/v02/forecast/{latitude}/{longitude}/trend14days"
-        url = f"https://api.kachelmannwetter.com/v02/forecast/{latitude}/{longitude}/advanced/6h"
-        return await self._get(url)
+        url = f"{self.base_url}/forecast/{latitude}/{longitude}/advanced/6h"
+        return await self._get(url, "forecast", project_forecast)
+
+    async def async_get_hourly_forecast(self, latitude: float, longitude: float) -> dict[str, Any]:
+        url = f"{self.base_url}/forecast/{latitude}/{longitude}/advanced/1h"
+        return await self._get(url, "hourly", project_hourly)
+
+
+def get_client(hass, api_key: str) -> KachelmannClient:
+    """Return the client shared by all config entries using ``api_key``.
+
+    Sharing the client shares its response cache and in-flight requests, so
+    entries at the same (or, with snap_to_grid, nearby) coordinates cost a
+    single API call.
+    """
+    clients: dict[str, KachelmannClient] = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_CLIENTS, {})
+    if api_key not in clients:
+        clients[api_key] = KachelmannClient(hass, api_key, rate_limiter=get_rate_limiter(hass, api_key))
+    return clients[api_key]
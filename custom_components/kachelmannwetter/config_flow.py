@@ -2,12 +2,22 @@
 from __future__ import annotations
 
 from logging import Logger, getLogger
+from uuid import uuid4
 
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
-
-from .const import DOMAIN, CONF_API_KEY, CONF_LATITUDE, CONF_LONGITUDE
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    DOMAIN,
+    CONF_API_KEY,
+    CONF_LATITUDE,
+    CONF_LOCATION_ID,
+    CONF_LOCATIONS,
+    CONF_LONGITUDE,
+    CONF_NAME,
+)
 from .client import KachelmannClient
 
 _LOGGER: Logger = getLogger(__package__)
@@ -85,10 +95,91 @@ class KachelmannOptionsFlow(config_entries.OptionsFlow):
         self.entry = entry
 
     async def async_step_init(self, user_input=None):
-        from .const import OPTION_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL, MIN_UPDATE_INTERVAL, MAX_UPDATE_INTERVAL
+        return self.async_show_menu(step_id="init", menu_options=["settings", "add_location", "remove_location"])
+
+    async def async_step_settings(self, user_input=None):
+        from .const import (
+            OPTION_UPDATE_INTERVAL,
+            DEFAULT_UPDATE_INTERVAL,
+            MIN_UPDATE_INTERVAL,
+            MAX_UPDATE_INTERVAL,
+            OPTION_SENSOR_TOLERANCE,
+            DEFAULT_SENSOR_TOLERANCE,
+            OPTION_ADAPTIVE_POLLING,
+            DEFAULT_ADAPTIVE_POLLING,
+            OPTION_MAX_STALE_AGE,
+            DEFAULT_MAX_STALE_AGE,
+            OPTION_RECORD_RESPONSES,
+            DEFAULT_RECORD_RESPONSES,
+            OPTION_PROFILE_UPDATES,
+            DEFAULT_PROFILE_UPDATES,
+            OPTION_SNAP_TO_GRID,
+            DEFAULT_SNAP_TO_GRID,
+        )
+
+        if user_input is not None:
+            # Keep the locations, they are edited in their own steps
+            return self.async_create_entry(title="options", data={**self.entry.options, **user_input})
+
+        options = self.entry.options
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    OPTION_UPDATE_INTERVAL, default=options.get(OPTION_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+                ): vol.All(int, vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL)),
+                vol.Optional(
+                    OPTION_SENSOR_TOLERANCE, default=options.get(OPTION_SENSOR_TOLERANCE, DEFAULT_SENSOR_TOLERANCE)
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    OPTION_ADAPTIVE_POLLING, default=options.get(OPTION_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)
+                ): bool,
+                vol.Optional(
+                    OPTION_MAX_STALE_AGE, default=options.get(OPTION_MAX_STALE_AGE, DEFAULT_MAX_STALE_AGE)
+                ): vol.All(int, vol.Range(min=0)),
+                vol.Optional(
+                    OPTION_SNAP_TO_GRID, default=options.get(OPTION_SNAP_TO_GRID, DEFAULT_SNAP_TO_GRID)
+                ): bool,
+                vol.Optional(
+                    OPTION_RECORD_RESPONSES, default=options.get(OPTION_RECORD_RESPONSES, DEFAULT_RECORD_RESPONSES)
+                ): bool,
+                vol.Optional(
+                    OPTION_PROFILE_UPDATES, default=options.get(OPTION_PROFILE_UPDATES, DEFAULT_PROFILE_UPDATES)
+                ): bool,
+            }
+        )
+        return self.async_show_form(step_id="settings", data_schema=schema)
+
+    async def async_step_add_location(self, user_input=None):
+        """Add a location; it is fetched by the entry's scheduler without a reload."""
+        if user_input is not None:
+            location = {CONF_LOCATION_ID: uuid4().hex, **user_input}
+            locations = [*self.entry.options.get(CONF_LOCATIONS, []), location]
+            return self.async_create_entry(title="options", data={**self.entry.options, CONF_LOCATIONS: locations})
 
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_NAME): str,
+                vol.Required(CONF_LATITUDE): float,
+                vol.Required(CONF_LONGITUDE): float,
+            }
+        )
+        return self.async_show_form(step_id="add_location", data_schema=schema)
+
+    async def async_step_remove_location(self, user_input=None):
+        """Remove added locations; the location of the entry itself stays."""
+        locations = self.entry.options.get(CONF_LOCATIONS, [])
+        if not locations:
+            return self.async_abort(reason="no_locations")
         if user_input is not None:
-            return self.async_create_entry(title="options", data=user_input)
+            removed = set(user_input[CONF_LOCATIONS])
+            locations = [location for location in locations if location[CONF_LOCATION_ID] not in removed]
+            return self.async_create_entry(title="options", data={**self.entry.options, CONF_LOCATIONS: locations})
 
-        schema = vol.Schema({vol.Optional(OPTION_UPDATE_INTERVAL, default=self.entry.options.get(OPTION_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)): int})
-        return self.async_show_form(step_id="init", data_schema=schema)
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_LOCATIONS): cv.multi_select(
+                    {location[CONF_LOCATION_ID]: location[CONF_NAME] for location in locations}
+                ),
+            }
+        )
+        return self.async_show_form(step_id="remove_location", data_schema=schema)
@@ -2,7 +2,7 @@
 
 DOMAIN = "kachelmannwetter"
 DEFAULT_NAME = "KachelmannWetter"
-PLATFORMS = ["weather"]
+PLATFORMS = ["weather", "sensor"]
 
 CONF_API_KEY = "api_key"
 CONF_LATITUDE = "latitude"
@@ -13,4 +13,80 @@ DEFAULT_UPDATE_INTERVAL = 600  # seconds
 MIN_UPDATE_INTERVAL = 60  # seconds
 MAX_UPDATE_INTERVAL = 3600  # seconds
 
+# The /advanced/6h forecast only changes when a new model run is published.
+# Runs start every MODEL_RUN_INTERVAL hours (UTC) and become available on the
+# API roughly MODEL_RUN_DELAY minutes later.
+MODEL_RUN_INTERVAL = 6  # hours
+MODEL_RUN_DELAY = 90  # minutes
+
 API_BASE = "https://api.kachelmannwetter.com/v02"
+
+# Token bucket shared by all entries using the same API key. The bucket is
+# re-sized from the x-ratelimit-* response headers once they are seen.
+DEFAULT_RATE_LIMIT = 600  # requests per RATE_LIMIT_PERIOD
+RATE_LIMIT_PERIOD = 3600  # seconds
+# Below this fraction of remaining quota polling intervals are stretched
+RATE_LIMIT_LOW_WATERMARK = 0.2
+MAX_INTERVAL_STRETCH = 8
+
+# Last normalized payload is persisted so setup can start from it
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30  # seconds
+
+# Opt-in: snap coordinates to a ~1 km grid so nearby locations share one
+# request and one cache entry. This moves the queried point by up to ~0.5 km.
+OPTION_SNAP_TO_GRID = "snap_to_grid"
+DEFAULT_SNAP_TO_GRID = False
+GRID_DECIMALS = 2
+
+# Sensors only write state when their value moved by more than this many of
+# their own tolerance steps (e.g. 0.1 °C, 0.5 hPa), so one setting fits all units
+OPTION_SENSOR_TOLERANCE = "sensor_tolerance"
+DEFAULT_SENSOR_TOLERANCE = 0.0
+
+# Adaptive polling: poll faster while weather is active, back off while stable
+OPTION_ADAPTIVE_POLLING = "adaptive_polling"
+DEFAULT_ADAPTIVE_POLLING = False
+ADAPTIVE_SPEEDUP = 4  # active interval = update interval / ADAPTIVE_SPEEDUP
+ADAPTIVE_BACKOFF = 1.5  # growth factor per stable update, up to MAX_UPDATE_INTERVAL
+ADAPTIVE_LOOKAHEAD = 6  # hours of forecast checked for upcoming activity
+ADAPTIVE_GUST_THRESHOLD = 10.0  # m/s
+
+# Resilience: per-request timeout, retries with jittered exponential backoff
+# and a circuit breaker per endpoint
+REQUEST_TIMEOUT = 20  # seconds
+REQUEST_RETRIES = 2  # additional attempts for transient errors
+RETRY_BACKOFF_BASE = 1.0  # seconds
+RETRY_BACKOFF_MAX = 10.0  # seconds
+CIRCUIT_FAILURE_THRESHOLD = 3  # consecutive failed fetches before opening
+CIRCUIT_RESET_TIMEOUT = 300  # seconds before a trial request is let through
+
+# Serve the last good data while the API fails, up to this age
+OPTION_MAX_STALE_AGE = "max_stale_age"
+DEFAULT_MAX_STALE_AGE = 10800  # seconds
+
+# Backfill of observation history into long-term statistics
+SERVICE_BACKFILL_STATISTICS = "backfill_statistics"
+BACKFILL_PAGE = 24  # hours of observations per request
+BACKFILL_BATCH = 7  # pages imported (and checkpointed) together
+
+# The 14-day trend changes slowly and is fetched at a low cadence
+TREND_UPDATE_INTERVAL = 12  # hours
+
+# Multi-location entries: additional locations are kept in the options and all
+# locations of an entry are refreshed by one scheduler, a few at a time
+CONF_LOCATIONS = "locations"
+CONF_LOCATION_ID = "id"
+CONF_NAME = "name"
+SCHEDULER_TICK = 30  # seconds between checks for due locations
+MAX_CONCURRENT_LOCATIONS = 4
+
+# Debugging aids: record raw API responses for offline replay
+# (scripts/replay.py) and profile normalization and entity updates
+OPTION_RECORD_RESPONSES = "record_responses"
+DEFAULT_RECORD_RESPONSES = False
+RECORDING_DIR = "kachelmannwetter_recordings"  # below the config directory
+RECORDING_MAX_BYTES = 20 * 1024 * 1024  # compressed; then rotated to <name>.1.jsonl.gz
+OPTION_PROFILE_UPDATES = "profile_updates"
+DEFAULT_PROFILE_UPDATES = False
+PROFILE_TOP_FUNCTIONS = 20  # functions per section in diagnostics
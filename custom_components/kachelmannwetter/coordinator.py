@@ -1,25 +1,75 @@
 """DataUpdateCoordinator for KachelmannWetter."""
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+import time
+from datetime import datetime, timedelta
 from logging import Logger, getLogger
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
-from .exceptions import RateLimitError, InvalidAuth
+from .exceptions import ApiUnavailableError, RateLimitError, InvalidAuth
 
-from .client import KachelmannClient
-from .helpers import normalize_current, normalize_forecasts
-from .const import DEFAULT_UPDATE_INTERVAL
+from .client import get_client, snap_to_grid
+from .ratelimit import get_rate_limiter
+from .helpers import (
+    CurrentConditions,
+    DailyForecastIndex,
+    ForecastSeries,
+    WeatherSnapshot,
+    normalize_current,
+    weather_is_active,
+)
+from .metrics import UpdateMetrics
+from .profiling import SectionProfiler
+from .const import (
+    ADAPTIVE_BACKOFF,
+    ADAPTIVE_GUST_THRESHOLD,
+    ADAPTIVE_LOOKAHEAD,
+    ADAPTIVE_SPEEDUP,
+    DEFAULT_MAX_STALE_AGE,
+    DEFAULT_NAME,
+    DEFAULT_UPDATE_INTERVAL,
+    MAX_UPDATE_INTERVAL,
+    MIN_UPDATE_INTERVAL,
+    DOMAIN,
+    MODEL_RUN_DELAY,
+    MODEL_RUN_INTERVAL,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    TREND_UPDATE_INTERVAL,
+)
 
 _LOGGER: Logger = getLogger(__package__)
 
 
+def next_model_run(now: datetime) -> datetime:
+    """Return when the next model run after ``now`` becomes available."""
+    delay = timedelta(minutes=MODEL_RUN_DELAY)
+    published = now - delay
+    run = published.replace(
+        hour=published.hour - published.hour % MODEL_RUN_INTERVAL, minute=0, second=0, microsecond=0
+    )
+    return run + timedelta(hours=MODEL_RUN_INTERVAL) + delay
+
+
+def location_prefix(entry_id: str, location_id: str | None = None) -> str:
+    """Prefix of the unique ids and storage keys of one location of an entry.
+
+    The location from the entry data keeps the bare entry id so entities and
+    stored data from before multi-location entries are picked up unchanged.
+    """
+    return f"{entry_id}_{location_id}" if location_id else entry_id
+
+
 class KachelmannDataUpdateCoordinator(DataUpdateCoordinator):
     def __init__(
         self,
@@ -28,40 +78,357 @@ class KachelmannDataUpdateCoordinator(DataUpdateCoordinator):
         latitude: float,
         longitude: float,
         update_interval_seconds: int | None = None,
+        entry_id: str | None = None,
+        adaptive_polling: bool = False,
+        max_stale_age: int = DEFAULT_MAX_STALE_AGE,
+        location_id: str | None = None,
+        location_name: str | None = None,
+        external_schedule: bool = False,
+        profiler: SectionProfiler | None = None,
+        snap: bool = False,
     ) -> None:
         self.api_key = api_key
+        if snap:
+            # Opt-in: nearby locations then share requests and cache entries
+            latitude, longitude = snap_to_grid(latitude, longitude)
         self.latitude = latitude
         self.longitude = longitude
-        self.client = KachelmannClient(hass, api_key)
+        self.rate_limiter = get_rate_limiter(hass, api_key)
+        self.client = get_client(hass, api_key)
+        # Last raw and normalized payloads; the client returns the same body
+        # object for cached/304 responses so these can skip re-normalizing.
+        self._current_raw: dict | None = None
+        self._current: CurrentConditions | None = None
+        self._forecast_raw: dict | None = None
+        self._forecast_entries: list[dict] = []
+        self._trend_raw: dict | None = None
+        self._trend_entries: list[dict] = []
+        self._trend_fetched: datetime | None = None
+        # The 1h forecast is only fetched while the weather entity has hourly
+        # forecast subscribers, and is not persisted
+        self._hourly_raw: dict | None = None
+        self._hourly_entries: list[dict] = []
+        self._hourly_refresh_at: datetime | None = None
+        self._hourly_wanted = False
+        # Set when a refresh is wanted before the next scheduled one; the
+        # scheduler picks it up on its next tick
+        self.refresh_requested = False
+        # Seconds until the API may be asked again after the last update was
+        # rate limited or hit an open circuit; the scheduler retries then
+        self.retry_after: int | None = None
+        # Merged 6h/trend daily forecast; survives across forecast series so
+        # only days whose inputs changed are recomputed
+        self._daily_index = DailyForecastIndex()
+        # Last forecast series, reused until the next model run is published.
+        # Its daily/twice-daily/hourly views are only built when requested.
+        self._forecast: ForecastSeries | None = None
+        self._forecast_refresh_at: datetime | None = None
+        self._forecast_fetched: datetime | None = None
+        self.metrics = UpdateMetrics()
+        self.profiler = profiler if profiler is not None else SectionProfiler()
+        # Last good data is served through API failures up to this age
+        self._max_stale_age = timedelta(seconds=max_stale_age)
+        self._last_success: datetime | None = None
+        # True while failed updates are answered with the last good data
+        self.serving_stale = False
+        self.unique_prefix = location_prefix(entry_id, location_id) if entry_id else None
+        # Repair issues persist across restarts; the first success clears any left over
+        self._stale_issue = self.unique_prefix is not None
+        self.display_name = f"{DEFAULT_NAME} {location_name}" if location_name else DEFAULT_NAME
+        self._store: Store | None = (
+            Store(hass, STORAGE_VERSION, f"{DOMAIN}.{self.unique_prefix}") if entry_id else None
+        )
         _LOGGER.debug("Coordinator initialized for %s,%s", latitude, longitude)
         if update_interval_seconds is None:
             update_interval_seconds = DEFAULT_UPDATE_INTERVAL
+        self._base_update_interval = timedelta(seconds=update_interval_seconds)
+        self.adaptive_polling = adaptive_polling
+        self._adaptive_interval = self._base_update_interval
+        # Interval until the next refresh is due. With an external schedule
+        # (multi-location entries) the coordinator runs no timer of its own and
+        # the scheduler reads this instead.
+        self.external_schedule = external_schedule
+        self.poll_interval = self._base_update_interval
 
         super().__init__(
             hass,
             _LOGGER,
             name="kachelmannwetter",
-            update_interval=timedelta(seconds=update_interval_seconds),
+            update_interval=None if external_schedule else self._base_update_interval,
+        )
+        self.metrics.effective_interval_seconds = self._base_update_interval.total_seconds()
+
+    def _next_adaptive_interval(self, now: datetime) -> timedelta:
+        """Poll faster while weather is active, back off towards the maximum while stable."""
+        active = weather_is_active(
+            self._current,
+            self._forecast,
+            now,
+            timedelta(hours=ADAPTIVE_LOOKAHEAD),
+            ADAPTIVE_GUST_THRESHOLD,
         )
+        self.metrics.weather_active = active
+        if active:
+            return max(timedelta(seconds=MIN_UPDATE_INTERVAL), self._base_update_interval / ADAPTIVE_SPEEDUP)
+        # Backing off never polls more often than configured; options saved
+        # before the interval was range-checked may exceed MAX_UPDATE_INTERVAL
+        ceiling = max(timedelta(seconds=MAX_UPDATE_INTERVAL), self._base_update_interval)
+        return max(self._base_update_interval, min(ceiling, self._adaptive_interval * ADAPTIVE_BACKOFF))
+
+    def _apply_update_interval(self, now: datetime | None = None) -> None:
+        """Pick the next polling interval.
+
+        Adaptive polling (if enabled, after successful updates) sets the base,
+        which is stretched while the shared API quota runs low.
+        """
+        if self.adaptive_polling and now is not None:
+            self._adaptive_interval = self._next_adaptive_interval(now)
+        interval = self._adaptive_interval if self.adaptive_polling else self._base_update_interval
+        interval *= self.rate_limiter.interval_factor
+        self.metrics.effective_interval_seconds = interval.total_seconds()
+        if interval != self.poll_interval:
+            _LOGGER.debug("Update interval for %s,%s set to %s", self.latitude, self.longitude, interval)
+            self.poll_interval = interval
+            if not self.external_schedule:
+                self.update_interval = interval
+
+    async def async_restore(self) -> tuple[WeatherSnapshot, datetime] | None:
+        """Load the last persisted snapshot.
+
+        Returns the coordinator data together with the time it was fetched, or
+        None when no usable snapshot exists.
+        """
+        if self._store is None:
+            return None
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:  # corrupt storage must never block setup
+            _LOGGER.warning("Could not load stored KachelmannWetter data: %s", err)
+            return None
+        if not stored:
+            return None
+        updated = dt_util.parse_datetime(stored.get("updated") or "")
+        forecast_fetched = dt_util.parse_datetime(stored.get("forecast_fetched") or "")
+        if updated is None or not stored.get("current"):
+            return None
+        self._current = CurrentConditions.from_dict(stored["current"])
+        if isinstance(stored.get("forecast"), list) and forecast_fetched is not None:
+            self._forecast_entries = stored["forecast"]
+            self._forecast_fetched = forecast_fetched
+            self._forecast_refresh_at = next_model_run(forecast_fetched)
+        trend_fetched = dt_util.parse_datetime(stored.get("trend_fetched") or "")
+        if isinstance(stored.get("trend"), list) and trend_fetched is not None:
+            self._trend_entries = stored["trend"]
+            self._trend_fetched = trend_fetched
+        if self._forecast_entries or self._trend_entries:
+            self._forecast = ForecastSeries(
+                self._forecast_entries, self._trend_entries, self._daily_index, dt_util.DEFAULT_TIME_ZONE
+            )
+        self._last_success = updated
+        _LOGGER.debug("Restored snapshot for %s,%s from %s", self.latitude, self.longitude, updated)
+        return WeatherSnapshot(self._current, self._forecast, updated), updated
+
+    def _snapshot(self) -> dict:
+        return {
+            "updated": dt_util.utcnow().isoformat(),
+            "forecast_fetched": self._forecast_fetched.isoformat() if self._forecast_fetched else None,
+            "current": self._current.as_dict() if self._current is not None else None,
+            "forecast": self._forecast_entries if self._forecast_fetched else None,
+            "trend_fetched": self._trend_fetched.isoformat() if self._trend_fetched else None,
+            "trend": self._trend_entries if self._trend_fetched else None,
+        }
+
+    @property
+    def data_age(self) -> timedelta | None:
+        """Age of the data currently served."""
+        if self._last_success is None:
+            return None
+        return dt_util.utcnow() - self._last_success
+
+    @property
+    def stale_issue_id(self) -> str:
+        return f"stale_data_{self.unique_prefix}"
 
-    async def _async_update_data(self) -> dict:
+    def _stale_data(self, err: Exception) -> WeatherSnapshot | None:
+        """Return the last good data if it is recent enough to keep serving.
+
+        The coordinator still reports success then, so the failure is surfaced
+        through ``serving_stale`` and a repair issue instead.
+        """
+        age = self.data_age
+        if self.data is None or age is None or age > self._max_stale_age:
+            self.serving_stale = False
+            return None
+        _LOGGER.warning(
+            "Update for %s,%s failed (%s), serving data from %s ago", self.latitude, self.longitude, err, age
+        )
+        self.serving_stale = True
+        self.metrics.stale_updates += 1
+        if self.unique_prefix is not None:
+            self._stale_issue = True
+            ir.async_create_issue(
+                self.hass,
+                DOMAIN,
+                self.stale_issue_id,
+                is_fixable=False,
+                severity=ir.IssueSeverity.WARNING,
+                translation_key="stale_data",
+                translation_placeholders={
+                    "name": self.display_name,
+                    "updated": self._last_success.isoformat(timespec="minutes"),
+                    "error": str(err) or type(err).__name__,
+                },
+            )
+        return self.data
+
+    def _clear_stale(self) -> None:
+        # The issue outlives serving_stale once the data got too old to serve
+        if self._stale_issue:
+            ir.async_delete_issue(self.hass, DOMAIN, self.stale_issue_id)
+            self._stale_issue = False
+        self.serving_stale = False
+
+    @callback
+    def async_update_listeners(self) -> None:
+        with self.profiler.section("entity_update"):
+            super().async_update_listeners()
+
+    async def _async_retry_refresh(self, _now: datetime) -> None:
+        await self.async_request_refresh()
+
+    @callback
+    def async_set_hourly_wanted(self, wanted: bool) -> None:
+        """Start or stop fetching the 1h forecast (hourly subscribers came or went)."""
+        if wanted == self._hourly_wanted:
+            return
+        self._hourly_wanted = wanted
+        if wanted and not self._hourly_entries:
+            # Fetch it now instead of at the next poll
+            if self.external_schedule:
+                self.refresh_requested = True
+            else:
+                self.hass.async_create_task(self.async_request_refresh())
+
+    async def _async_get_hourly(self) -> dict | None:
+        """Fetch the 1h forecast; returns None on failure so the previous one is kept."""
+        try:
+            return await self.client.async_get_hourly_forecast(self.latitude, self.longitude)
+        except InvalidAuth:
+            raise
+        except Exception as err:
+            _LOGGER.warning("Could not fetch hourly forecast for %s,%s: %s", self.latitude, self.longitude, err)
+            return None
+
+    async def _async_get_trend(self) -> dict | None:
+        """Fetch the 14-day trend; returns None on failure so the previous trend is kept."""
+        try:
+            return await self.client.async_get_trend(self.latitude, self.longitude)
+        except InvalidAuth:
+            raise
+        except Exception as err:
+            _LOGGER.warning("Could not fetch 14-day trend for %s,%s: %s", self.latitude, self.longitude, err)
+            return None
+
+    async def _async_update_data(self) -> WeatherSnapshot:
         _LOGGER.debug("Starting data update for %s,%s", self.latitude, self.longitude)
+        self.refresh_requested = False
+        self.retry_after = None
+        now = dt_util.utcnow()
+        refresh_forecast = self._forecast_refresh_at is None or now >= self._forecast_refresh_at
+        refresh_trend = self._trend_fetched is None or now >= self._trend_fetched + timedelta(
+            hours=TREND_UPDATE_INTERVAL
+        )
+        refresh_hourly = self._hourly_wanted and (
+            self._hourly_refresh_at is None or now >= self._hourly_refresh_at
+        )
         try:
-            current = await self.client.async_get_current(self.latitude, self.longitude)
-            forecast = await self.client.async_get_forecast(self.latitude, self.longitude)
-            # normalize current condition fields for consistent entity mapping
-            normalized_current = normalize_current(current or {})
-            normalized_forecasts = normalize_forecasts(forecast or {})
-            return {"current": normalized_current, "forecast": normalized_forecasts}
-        except RateLimitError as err:
+            fetches = [self.client.async_get_current(self.latitude, self.longitude)]
+            if refresh_forecast:
+                fetches.append(self.client.async_get_forecast(self.latitude, self.longitude))
+            if refresh_trend:
+                fetches.append(self._async_get_trend())
+            if refresh_hourly:
+                fetches.append(self._async_get_hourly())
+            results = iter(await asyncio.gather(*fetches))
+            current = next(results)
+            forecast = next(results) if refresh_forecast else self._forecast_raw
+            trend = next(results) if refresh_trend else self._trend_raw
+            hourly = next(results) if refresh_hourly else self._hourly_raw
+            with self.profiler.section("normalize"):
+                started = time.perf_counter()
+                normalized = False
+                # normalize current condition fields for consistent entity mapping
+                if current is not self._current_raw or self._current is None:
+                    self._current = normalize_current(current or {})
+                    self._current_raw = current
+                    normalized = True
+                forecast_changed = False
+                if refresh_forecast:
+                    if forecast is not self._forecast_raw:
+                        self._forecast_raw = forecast
+                        self._forecast_entries = (forecast or {}).get("data", [])
+                        forecast_changed = True
+                    self._forecast_fetched = now
+                    self._forecast_refresh_at = next_model_run(now)
+                    _LOGGER.debug("Forecast refreshed, next refresh at %s", self._forecast_refresh_at)
+                if refresh_trend and trend is not None:
+                    if trend is not self._trend_raw:
+                        self._trend_raw = trend
+                        self._trend_entries = (trend or {}).get("data", [])
+                        forecast_changed = True
+                    self._trend_fetched = now
+                if refresh_hourly and hourly is not None:
+                    if hourly is not self._hourly_raw:
+                        self._hourly_raw = hourly
+                        self._hourly_entries = (hourly or {}).get("data", [])
+                        forecast_changed = True
+                    self._hourly_refresh_at = next_model_run(now)
+                elif not self._hourly_wanted and self._hourly_raw is not None:
+                    # The last hourly subscriber is gone
+                    self._hourly_raw = None
+                    self._hourly_entries = []
+                    self._hourly_refresh_at = None
+                    forecast_changed = True
+                if forecast_changed or self._forecast is None:
+                    # Views are built lazily and bucket days in the Home Assistant time
+                    # zone; the daily index only recomputes changed days
+                    self._forecast = ForecastSeries(
+                        self._forecast_entries,
+                        self._trend_entries,
+                        self._daily_index,
+                        dt_util.DEFAULT_TIME_ZONE,
+                        self._hourly_entries,
+                    )
+                    normalized = True
+                if normalized:
+                    self.metrics.record_normalization(time.perf_counter() - started)
+            self.metrics.updates += 1
+            self._apply_update_interval(now)
+            self._last_success = now
+            self._clear_stale()
+            if self._store is not None:
+                self._store.async_delay_save(self._snapshot, STORAGE_SAVE_DELAY)
+            return WeatherSnapshot(self._current, self._forecast, now)
+        except (RateLimitError, ApiUnavailableError) as err:
+            self.metrics.failures += 1
             retry = getattr(err, "retry_after", None)
-            _LOGGER.warning("Rate limited by Kachelmann API, retry after %s seconds", retry)
-            if retry:
+            _LOGGER.warning("Kachelmann API unavailable (%s), retry after %s seconds", err, retry)
+            self._apply_update_interval()
+            if retry and self.external_schedule:
+                # The scheduler retries within its concurrency limit
+                self.retry_after = retry
+            elif retry:
                 # schedule a refresh after retry seconds
-                async_call_later(self.hass, retry, lambda _now: self.async_request_refresh())
-            raise UpdateFailed("Rate limited by Kachelmann API") from err
+                async_call_later(self.hass, retry, self._async_retry_refresh)
+            if (stale := self._stale_data(err)) is not None:
+                return stale
+            raise UpdateFailed(f"Kachelmann API unavailable: {err}") from err
         except InvalidAuth as err:
+            self.metrics.failures += 1
             _LOGGER.error("Invalid API key for KachelmannWetter: %s", err)
             raise
         except Exception as err:
+            self.metrics.failures += 1
+            if (stale := self._stale_data(err)) is not None:
+                return stale
             raise UpdateFailed(f"Error fetching data: {err}") from err
@@ -0,0 +1,52 @@
+"""Diagnostics support for KachelmannWetter."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_API_KEY, CONF_LATITUDE, CONF_LONGITUDE, DOMAIN
+
+TO_REDACT = {CONF_API_KEY, CONF_LATITUDE, CONF_LONGITUDE}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    scheduler = hass.data[DOMAIN][entry.entry_id]
+    # The client and rate limiter are shared by all locations using the same API key
+    coordinator = next(iter(scheduler.coordinators.values()))
+    limiter = coordinator.rate_limiter
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "locations": {
+            location.unique_prefix: {
+                "update_interval_seconds": location.poll_interval.total_seconds(),
+                "last_update_success": location.last_update_success,
+                "serving_stale": location.serving_stale,
+                "data_age_seconds": age.total_seconds() if (age := location.data_age) is not None else None,
+                "coordinator": location.metrics.as_dict(),
+            }
+            for location in scheduler.coordinators.values()
+        },
+        "circuit_breakers": {
+            endpoint: {"state": breaker.state, "failures": breaker.failures, "retry_after": breaker.retry_after}
+            for endpoint, breaker in coordinator.client.circuit_breakers.items()
+        },
+        "client": coordinator.client.metrics.as_dict(),
+        "rate_limit": {
+            "capacity": limiter.capacity,
+            "period_seconds": limiter.period,
+            "remaining": limiter.remaining,
+            "interval_factor": limiter.interval_factor,
+        },
+        "recording": (
+            {"path": recorder.path.name, "responses": recorder.responses}
+            if (recorder := coordinator.client.recorders.get(entry.entry_id)) is not None
+            else None
+        ),
+        "profile": scheduler.profiler.as_dict() if scheduler.profiler.enabled else None,
+    }
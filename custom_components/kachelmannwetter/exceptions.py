@@ -19,3 +19,15 @@ class RateLimitError(KachelmannError):
     def __init__(self, message: str = "rate limit", retry_after: int | None = None) -> None:
         super().__init__(message)
         self.retry_after = retry_after
+
+
+class ApiUnavailableError(KachelmannError):
+    """Raised without a request while the circuit breaker of an endpoint is open.
+
+    Attributes:
+        retry_after: seconds until a trial request is allowed
+    """
+
+    def __init__(self, message: str = "API unavailable", retry_after: int | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
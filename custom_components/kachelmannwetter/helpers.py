@@ -1,8 +1,9 @@
 """Helpers to normalize Kachelmann API responses to canonical keys."""
 from __future__ import annotations
 
+from dataclasses import asdict, dataclass, fields
 from typing import Any
-from datetime import datetime, date
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
 
 WEATHER_SYMBOL_DICT = {
     "cloudy": "cloudy",
@@ -28,100 +29,716 @@ WEATHER_SYMBOL_DICT = {
     "wind": "windy",
 }
 
-def safeget(dct, *keys):
-    for key in keys:
-        try:
-            dct = dct[key]
-        except KeyError:
-            return None
-    return dct
+# Rank of each condition by its first position in WEATHER_SYMBOL_DICT; the
+# highest ranked condition of a day represents that day.
+CONDITION_RANK: dict[str, int] = {}
+for _rank, _condition in enumerate(WEATHER_SYMBOL_DICT.values()):
+    CONDITION_RANK.setdefault(_condition, _rank)
 
-def normalize_current(data: dict[str, Any]) -> dict[str, Any]:
-    if not data:
-        return {}
+# Fields of the API responses that the normalizers read; everything else is
+# dropped right after decoding so full bodies are not kept in memory.
+CURRENT_FIELDS = (
+    "temp",
+    "humidityRelative",
+    "pressureMsl",
+    "windSpeed",
+    "windGust",
+    "windDirection",
+    "prec1h",
+    "dewpoint",
+    "weatherSymbol",
+)
+FORECAST_FIELDS = (
+    "dateTime",
+    "weatherSymbol",
+    "cloudCoverage",
+    "humidityRelative",
+    "dewpoint",
+    "prec6h",
+    "pressureMsl",
+    "tempMax6h",
+    "tempMin6h",
+    "windGust",
+    "windSpeed",
+    "windDirection",
+)
+
+HOURLY_FIELDS = (
+    "dateTime",
+    "weatherSymbol",
+    "cloudCoverage",
+    "humidityRelative",
+    "dewpoint",
+    "prec1h",
+    "pressureMsl",
+    "temp",
+    "windGust",
+    "windSpeed",
+    "windDirection",
+)
+
+TREND_FIELDS = (
+    "dateTime",
+    "weatherSymbol",
+    "tempMax",
+    "tempMin",
+    "prec",
+    "precProb",
+    "cloudCoverage",
+    "humidityRelative",
+    "pressureMsl",
+    "windSpeed",
+    "windGust",
+    "windDirection",
+)
 
+# Observation fields that can be backfilled, keyed by sensor key
+OBSERVATION_FIELDS = {
+    "temperature": "temp",
+    "dew_point": "dewpoint",
+    "wind_gust": "windGust",
+    "precipitation_1h": "prec1h",
+    "pressure": "pressureMsl",
+}
+
+def project_current(body: Any) -> dict[str, Any]:
+    """Reduce a /current response to the fields used by normalize_current."""
+    data = body.get("data") if isinstance(body, dict) else None
+    if not isinstance(data, dict):
+        return {}
     out: dict[str, Any] = {}
+    for field in CURRENT_FIELDS:
+        value = data.get(field)
+        if isinstance(value, dict) and "value" in value:
+            out[field] = {"value": value["value"]}
+    return {"data": out}
 
-    out["temperature"] = safeget(data, "data", "temp", "value")
-    out["humidity"] = safeget(data, "data", "humidityRelative", "value")
-    out["pressure"] = safeget(data, "data", "pressureMsl", "value")
-    out["wind_speed"] = safeget(data, "data", "windSpeed", "value")
-    out["wind_gust"] = safeget(data, "data", "windGust", "value")
-    out["wind_bearing"] = safeget(data, "data", "windDirection", "value")
-    out["precipitation_1h"] = safeget(data, "data", "prec1h", "value")
-    # out["precipitation_24h"] = _first("precipitation_24h", "rain_24h", "precip_24h", data=data)
-    # out["visibility"] = _first("visibility", "vis", data=data)
-    out["condition"] = WEATHER_SYMBOL_DICT.get(safeget(data, "data", "weatherSymbol", "value"))
-    # out["timestamp"] = _first("timestamp", "time", "date", data=data)
-    # out["station"] = _first("station", "station_id", "stationName", data=data) 
-
-    return out
-
-def normalize_forecasts(data: dict[str, Any]) -> dict[str, Any]:
-    # This expecting data in 6h steps from /advanced/6h endpoint
-    # We want to provide daily forecasts from this
-    if not data:
+def project_forecast(body: Any, fields: tuple[str, ...] = FORECAST_FIELDS) -> dict[str, Any]:
+    """Reduce a forecast response to the step fields used by the forecast views."""
+    entries = body.get("data") if isinstance(body, dict) else None
+    if not isinstance(entries, list):
         return {}
+    return {
+        "data": [
+            {field: entry[field] for field in fields if field in entry}
+            for entry in entries
+            if isinstance(entry, dict) and "dateTime" in entry
+        ]
+    }
 
-    out: dict[str, Any] = {}
-    out["daily"] = []
-    daily_data: dict[date, dict[str, Any]] = {}
-    
-    for entry in data.get("data", []):
-        
-        date_key = datetime.fromisoformat(entry["dateTime"]).date()
-        timeofday = datetime.fromisoformat(entry["dateTime"]).time()
-        if date_key not in daily_data:
-            daily_data[date_key] = {
-                "cloud_coverage": [],
-                "condition": set(),
-                "humidity": [],
-                "native_apparent_temperature": [],
-                "native_dew_point": [],
-                "native_precipitation": [],
-                "native_pressure": [],
-                "native_temperature": [],
-                "native_templow": [],
-                "native_wind_gust_speed": [],
-                "native_wind_speed": [],
-                "precipitation_probability": [],
-                "uv_index": [],
-                "wind_bearing": [],
-                "timeofday": timeofday,
-            }
-            
-        
-        daily_data[date_key]["cloud_coverage"].append(entry.get("cloudCoverage"))
-        daily_data[date_key]["condition"].add(WEATHER_SYMBOL_DICT.get(entry.get("weatherSymbol")))
-        daily_data[date_key]["humidity"].append(entry.get("humidityRelative"))
-        daily_data[date_key]["native_dew_point"].append(entry.get("dewpoint"))
-        daily_data[date_key]["native_precipitation"].append(entry.get("prec6h", 0))
-        daily_data[date_key]["native_pressure"].append(entry.get("pressureMsl"))
-        daily_data[date_key]["native_temperature"].append(entry["tempMax6h"])
-        daily_data[date_key]["native_templow"].append(entry["tempMin6h"])
-        daily_data[date_key]["native_wind_gust_speed"].append(entry.get("windGust"))
-        daily_data[date_key]["native_wind_speed"].append(entry.get("windSpeed"))
-        #daily_data[date_key]["precipitation_probability"].append(entry.get("precProb"))
-        #daily_data[date_key]["uv_index"].append(entry.get("uvIndex"))
-        daily_data[date_key]["wind_bearing"].append(entry.get("windDirection"))
-
-    for date_key, entry in daily_data.items():
+
+def project_hourly(body: Any) -> dict[str, Any]:
+    """Reduce an /advanced/1h response to the fields used by the hourly view."""
+    return project_forecast(body, HOURLY_FIELDS)
+
+@dataclass(frozen=True, slots=True)
+class CurrentConditions:
+    """Normalized current conditions, built once per update."""
+
+    temperature: float | None = None
+    humidity: float | None = None
+    pressure: float | None = None
+    wind_speed: float | None = None
+    wind_gust: float | None = None
+    wind_bearing: float | None = None
+    precipitation_1h: float | None = None
+    dew_point: float | None = None
+    condition: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CurrentConditions:
+        return cls(**{field.name: data.get(field.name) for field in fields(cls)})
+
+
+@dataclass(frozen=True, slots=True)
+class ForecastDay:
+    """One aggregated forecast period (a day, or half a day when is_daytime is set)."""
+
+    datetime: str
+    condition: str | None = None
+    cloud_coverage: float | None = None
+    humidity: float | None = None
+    native_dew_point: float | None = None
+    native_precipitation: float | None = None
+    native_pressure: float | None = None
+    native_temperature: float | None = None
+    native_templow: float | None = None
+    native_wind_gust_speed: float | None = None
+    native_wind_speed: float | None = None
+    precipitation_probability: float | None = None
+    wind_bearing: int | None = None
+    is_daytime: bool | None = None
+
+    def as_forecast(self) -> dict[str, Any]:
+        """Return the Forecast dict handed to Home Assistant."""
         forecast = {
-            "datetime": date_key.isoformat(),
-            "condition": max(entry["condition"], key=lambda x: list(WEATHER_SYMBOL_DICT.values()).index(x)) if entry["condition"] else None,
-            "cloudCoverage": sum(entry["cloud_coverage"])/len(entry["cloud_coverage"]) if entry["cloud_coverage"] else None,
-            "humidity": sum(entry["humidity"])/len(entry["humidity"]) if entry["humidity"] else None,
-            "native_dew_point": sum(entry["native_dew_point"])/len(entry["native_dew_point"]) if entry["native_dew_point"] else None,
-            "native_precipitation": sum(entry["native_precipitation"]) if entry["native_precipitation"] else 0,
-            "native_pressure": sum(entry["native_pressure"])/len(entry["native_pressure"]) if entry["native_pressure"] else None,
-            "native_temperature": max(entry["native_temperature"]) if entry["native_temperature"] else None,
-            "native_templow": min(entry["native_templow"]) if entry["native_templow"] else None,
-            "native_wind_gust_speed": max(entry["native_wind_gust_speed"]) if entry["native_wind_gust_speed"] else None,
-            "native_wind_speed": max(entry["native_wind_speed"]) if entry["native_wind_speed"] else None,
-            "precipitation_probability": max(entry["precipitation_probability"]) if entry["precipitation_probability"] else None,
-            "wind_bearing": int(sum(entry["wind_bearing"])/len(entry["wind_bearing"])) if entry["wind_bearing"] else None,
-            # Add more fields as needed
+            "datetime": self.datetime,
+            "condition": self.condition,
+            "cloud_coverage": self.cloud_coverage,
+            "humidity": self.humidity,
+            "native_dew_point": self.native_dew_point,
+            "native_precipitation": self.native_precipitation,
+            "native_pressure": self.native_pressure,
+            "native_temperature": self.native_temperature,
+            "native_templow": self.native_templow,
+            "native_wind_gust_speed": self.native_wind_gust_speed,
+            "native_wind_speed": self.native_wind_speed,
+            "precipitation_probability": self.precipitation_probability,
+            "wind_bearing": self.wind_bearing,
         }
-        out["daily"].append(forecast)
-  
-    return out
\ No newline at end of file
+        if self.is_daytime is not None:
+            forecast["is_daytime"] = self.is_daytime
+        return forecast
+
+
+# Conditions during which fresh data matters most
+ACTIVE_CONDITIONS = frozenset(
+    {"exceptional", "lightning-rainy", "pouring", "rainy", "snowy", "snowy-rainy"}
+)
+
+
+def weather_is_active(
+    current: CurrentConditions | None,
+    series: ForecastSeries | None,
+    now: datetime,
+    lookahead: timedelta,
+    gust_threshold: float,
+) -> bool:
+    """Return True if precipitation, strong gusts or an active condition is present or forecast soon."""
+    if current is not None and (
+        current.precipitation_1h
+        or (current.wind_gust or 0) >= gust_threshold
+        or current.condition in ACTIVE_CONDITIONS
+    ):
+        return True
+    if series is None:
+        return False
+    # Timestamps come from the series' time index, parsed once per payload
+    now_ts = now.timestamp()
+    horizon = now_ts + lookahead.total_seconds()
+    step = FORECAST_STEP_SECONDS
+    for timestamp, entry in zip(series.time_index().timestamps, series.entries):
+        # A step covers the period before its timestamp: it counts if that
+        # period overlaps [now, horizon]
+        if timestamp - step > horizon:
+            break
+        if timestamp <= now_ts:
+            continue
+        if entry.get("prec6h") or WEATHER_SYMBOL_DICT.get(entry.get("weatherSymbol")) in ACTIVE_CONDITIONS:
+            return True
+    return False
+
+
+def _value(data: dict[str, Any], field: str) -> Any:
+    item = data.get(field)
+    return item.get("value") if isinstance(item, dict) else None
+
+
+def project_trend(body: Any) -> dict[str, Any]:
+    """Reduce a /trend14days response to the daily fields used by trend_day."""
+    entries = body.get("data") if isinstance(body, dict) else None
+    if not isinstance(entries, list):
+        return {}
+    return {
+        "data": [
+            {field: entry[field] for field in TREND_FIELDS if field in entry}
+            for entry in entries
+            if isinstance(entry, dict) and "dateTime" in entry
+        ]
+    }
+
+def project_observations(body: Any) -> dict[str, Any]:
+    """Reduce an observation history response to timestamps and backfilled fields."""
+    entries = body.get("data") if isinstance(body, dict) else None
+    if not isinstance(entries, list):
+        return {}
+    out = []
+    for entry in entries:
+        if not isinstance(entry, dict) or "dateTime" not in entry:
+            continue
+        step = {"dateTime": entry["dateTime"]}
+        for field in OBSERVATION_FIELDS.values():
+            value = entry.get(field)
+            # accept both flat values and the {"value": ...} shape of /current
+            step[field] = value.get("value") if isinstance(value, dict) else value
+        out.append(step)
+    return {"data": out}
+
+def hourly_statistics(entries: list[dict[str, Any]], field: str) -> list[dict[str, Any]]:
+    """Aggregate observations of ``field`` into hourly mean/min/max rows.
+
+    Row starts are top-of-hour UTC as required by long-term statistics.
+    """
+    hours: dict[datetime, list[float]] = {}
+    for entry in entries:
+        value = entry.get(field)
+        if value is None:
+            continue
+        moment = datetime.fromisoformat(entry["dateTime"])
+        # Same as dt_util.as_utc; naive timestamps are taken as UTC
+        moment = moment.replace(tzinfo=timezone.utc) if moment.tzinfo is None else moment.astimezone(timezone.utc)
+        start = moment.replace(minute=0, second=0, microsecond=0)
+        hours.setdefault(start, []).append(value)
+    return [
+        {"start": start, "mean": sum(values) / len(values), "min": min(values), "max": max(values)}
+        for start, values in sorted(hours.items())
+    ]
+
+def normalize_current(data: dict[str, Any]) -> CurrentConditions:
+    values = data.get("data") if data else None
+    if not isinstance(values, dict):
+        return CurrentConditions()
+
+    return CurrentConditions(
+        temperature=_value(values, "temp"),
+        humidity=_value(values, "humidityRelative"),
+        pressure=_value(values, "pressureMsl"),
+        wind_speed=_value(values, "windSpeed"),
+        wind_gust=_value(values, "windGust"),
+        wind_bearing=_value(values, "windDirection"),
+        precipitation_1h=_value(values, "prec1h"),
+        dew_point=_value(values, "dewpoint"),
+        condition=WEATHER_SYMBOL_DICT.get(_value(values, "weatherSymbol")),
+    )
+
+
+def _aggregate(entries: list[dict[str, Any]], start: str, is_daytime: bool | None = None) -> ForecastDay:
+    """Aggregate the forecast steps of one period (day or half-day).
+
+    Single pass with running sum/count/min/max accumulators kept in locals,
+    which is cheaper than per-field value lists or attribute updates.
+    """
+    condition = None
+    condition_rank = -1
+    cloud_sum = humidity_sum = dew_point_sum = pressure_sum = bearing_sum = 0
+    cloud_count = humidity_count = dew_point_count = pressure_count = bearing_count = 0
+    precipitation = 0
+    temperature = templow = wind_gust_speed = wind_speed = None
+    symbols = WEATHER_SYMBOL_DICT
+    ranks = CONDITION_RANK
+    for entry in entries:
+        get = entry.get
+        value = symbols.get(get("weatherSymbol"))
+        if value is not None and ranks[value] > condition_rank:
+            condition = value
+            condition_rank = ranks[value]
+        value = get("cloudCoverage")
+        if value is not None:
+            cloud_sum += value
+            cloud_count += 1
+        value = get("humidityRelative")
+        if value is not None:
+            humidity_sum += value
+            humidity_count += 1
+        value = get("dewpoint")
+        if value is not None:
+            dew_point_sum += value
+            dew_point_count += 1
+        value = get("prec6h")
+        if value is not None:
+            precipitation += value
+        value = get("pressureMsl")
+        if value is not None:
+            pressure_sum += value
+            pressure_count += 1
+        value = get("tempMax6h")
+        if value is not None and (temperature is None or value > temperature):
+            temperature = value
+        value = get("tempMin6h")
+        if value is not None and (templow is None or value < templow):
+            templow = value
+        value = get("windGust")
+        if value is not None and (wind_gust_speed is None or value > wind_gust_speed):
+            wind_gust_speed = value
+        value = get("windSpeed")
+        if value is not None and (wind_speed is None or value > wind_speed):
+            wind_speed = value
+        value = get("windDirection")
+        if value is not None:
+            bearing_sum += value
+            bearing_count += 1
+    return ForecastDay(
+        datetime=start,
+        condition=condition,
+        cloud_coverage=cloud_sum / cloud_count if cloud_count else None,
+        humidity=humidity_sum / humidity_count if humidity_count else None,
+        native_dew_point=dew_point_sum / dew_point_count if dew_point_count else None,
+        native_precipitation=precipitation,
+        native_pressure=pressure_sum / pressure_count if pressure_count else None,
+        native_temperature=temperature,
+        native_templow=templow,
+        native_wind_gust_speed=wind_gust_speed,
+        native_wind_speed=wind_speed,
+        # precipitation_probability is not provided by /advanced/6h
+        wind_bearing=int(bearing_sum / bearing_count) if bearing_count else None,
+        is_daytime=is_daytime,
+    )
+
+
+def _group(ids: list[int], entries: list[dict[str, Any]]) -> dict[int, list[dict[str, Any]]]:
+    """Steps by bucket id; insertion order keeps the buckets chronological."""
+    groups: dict[int, list[dict[str, Any]]] = {}
+    for bucket, entry in zip(ids, entries):
+        steps = groups.get(bucket)
+        if steps is None:
+            groups[bucket] = [entry]
+        else:
+            steps.append(entry)
+    return groups
+
+
+# Native step of the /advanced/6h forecast. A step covers the period before
+# its timestamp (prec6h, tempMax6h, ...), so steps are bucketed by its start.
+FORECAST_STEP_SECONDS = 6 * 3600
+FORECAST_STEP_SHIFT = timedelta(seconds=-FORECAST_STEP_SECONDS)
+
+# Trend entries stand for whole days; they are bucketed by their midday
+TREND_DAY_SHIFT = timedelta(hours=12)
+
+
+class ForecastTimeIndex:
+    """Local-time bucket ids of forecast steps, computed once per payload.
+
+    ``days[i]`` is the ordinal of the local date of step ``i`` and
+    ``halves[i]`` the id ``2 * ordinal`` of the day period (06-18) or
+    ``2 * ordinal + 1`` of the night period (18-06) it falls into; a night
+    belongs to the date it starts on. ``timestamps[i]`` is the POSIX time of
+    the step. Without ``tz`` the payload's own UTC offset is used.
+
+    ``shift`` is added before bucketing; whole-day entries such as the
+    14-day trend are bucketed by their midday so that a day starting at UTC
+    midnight lands on the same local date, 6h steps by the start of the
+    period they cover. ``timestamps`` are never shifted.
+    """
+
+    __slots__ = ("tz", "days", "_moments", "_local", "_halves", "_timestamps")
+
+    def __init__(
+        self, entries: list[dict[str, Any]], tz: tzinfo | None = None, shift: timedelta | None = None
+    ) -> None:
+        # Each timestamp is parsed once and days are read from the local wall
+        # clock; halves and timestamps are only computed when asked for
+        parse = datetime.fromisoformat
+        moments = [parse(entry["dateTime"]) for entry in entries]
+        if any(moment.tzinfo is None for moment in moments):
+            moments = [moment.replace(tzinfo=timezone.utc) if moment.tzinfo is None else moment for moment in moments]
+        self._moments = moments
+        self._halves: list[int] | None = None
+        self._timestamps: list[float] | None = None
+        self.tz = tz if tz is not None or not moments else moments[-1].tzinfo
+
+        offset = shift or timedelta()
+        if tz is not None and moments:
+            first = moments[0] + offset
+            last = moments[-1] + offset
+            if (
+                first.utcoffset() == last.utcoffset()
+                and first.astimezone(tz).utcoffset() == last.astimezone(tz).utcoffset()
+            ):
+                # No offset change within the payload (a zone does not change its
+                # offset back and forth within two weeks): one shift for all
+                offset += first.astimezone(tz).utcoffset() - first.utcoffset()
+            else:
+                offset = None
+        if offset is None:
+            local = [(moment + shift if shift else moment).astimezone(tz) for moment in moments]
+        elif offset:
+            local = [moment + offset for moment in moments]
+        else:
+            local = moments
+        self._local = local
+        self.days = [moment.toordinal() for moment in local]
+
+    @property
+    def halves(self) -> list[int]:
+        """Day/night period id of each step."""
+        if self._halves is None:
+            self._halves = [
+                2 * ordinal - 1 if moment.hour < 6 else 2 * ordinal if moment.hour < 18 else 2 * ordinal + 1
+                for ordinal, moment in zip(self.days, self._local)
+            ]
+        return self._halves
+
+    @property
+    def timestamps(self) -> list[float]:
+        """POSIX time of each step."""
+        if self._timestamps is None:
+            self._timestamps = [moment.timestamp() for moment in self._moments]
+        return self._timestamps
+
+    @staticmethod
+    def day_start(day: int) -> str:
+        return date.fromordinal(day).isoformat()
+
+    def half_start(self, half: int) -> str:
+        hour = 18 if half % 2 else 6
+        return datetime.combine(date.fromordinal(half // 2), time(hour), self.tz).isoformat()
+
+
+def forecast_days(entries: list[dict[str, Any]], index: ForecastTimeIndex | None = None) -> tuple[ForecastDay, ...]:
+    """Aggregate forecast steps into one ForecastDay per (local) day."""
+    if index is None:
+        index = ForecastTimeIndex(entries)
+    return tuple(_aggregate(steps, index.day_start(day_id)) for day_id, steps in _group(index.days, entries).items())
+
+
+def trend_day(date_key: date, entry: dict[str, Any]) -> ForecastDay:
+    """Map one day of the 14-day trend to a ForecastDay."""
+    return ForecastDay(
+        datetime=date_key.isoformat(),
+        condition=WEATHER_SYMBOL_DICT.get(entry.get("weatherSymbol")),
+        cloud_coverage=entry.get("cloudCoverage"),
+        humidity=entry.get("humidityRelative"),
+        native_precipitation=entry.get("prec"),
+        native_pressure=entry.get("pressureMsl"),
+        native_temperature=entry.get("tempMax"),
+        native_templow=entry.get("tempMin"),
+        native_wind_gust_speed=entry.get("windGust"),
+        native_wind_speed=entry.get("windSpeed"),
+        precipitation_probability=entry.get("precProb"),
+        wind_bearing=entry.get("windDirection"),
+    )
+
+
+def _same_source(old: tuple[str, Any] | None, new: tuple[str, Any]) -> bool:
+    """True if a day's inputs are the very same objects as last time.
+
+    The client returns the same body objects for unchanged (cached or 304)
+    responses, so identity is enough and avoids comparing entry contents.
+    """
+    if old is None or old[0] != new[0]:
+        return False
+    if new[0] == "trend":
+        return old[1] is new[1]
+    return len(old[1]) == len(new[1]) and all(a is b for a, b in zip(old[1], new[1]))
+
+
+def _daily_inputs(
+    entries: list[dict[str, Any]],
+    trend: list[dict[str, Any]],
+    index: ForecastTimeIndex,
+    trend_index: ForecastTimeIndex,
+) -> dict[int, tuple[str, Any]]:
+    """Pick the source of each day: its 6h steps or its trend entry, by date ordinal."""
+    inputs: dict[int, tuple[str, Any]] = {}
+    for day_id, entry in zip(trend_index.days, trend):
+        inputs[day_id] = ("trend", entry)
+    steps = _group(index.days, entries)
+    timestamps = index.timestamps
+    step = timestamps[1] - timestamps[0] if len(timestamps) > 1 else FORECAST_STEP_SECONDS
+    for day_id, day_steps in steps.items():
+        # 23h tolerates the short day of a DST change
+        if day_id not in inputs or len(day_steps) * step >= 23 * 3600:
+            inputs[day_id] = ("6h", day_steps)
+    return inputs
+
+
+def _daily_forecast_day(day_id: int, source: tuple[str, Any]) -> ForecastDay:
+    if source[0] == "trend":
+        return trend_day(date.fromordinal(day_id), source[1])
+    return _aggregate(source[1], ForecastTimeIndex.day_start(day_id))
+
+
+class DailyForecastIndex:
+    """Daily forecast merged from 6h steps and the 14-day trend, keyed by date ordinal.
+
+    The 6h steps take precedence on dates they cover completely. Partly
+    covered dates (the tail of the 6h horizon, the elapsed part of today) use
+    the trend day when there is one, since a few steps give a misleading
+    high/low. The inputs of each day are kept by identity, so a refresh of
+    either source only recomputes the days whose inputs changed.
+    """
+
+    def __init__(self) -> None:
+        self._inputs: dict[int, tuple[str, Any]] = {}
+        self._days: dict[int, ForecastDay] = {}
+        self.recomputed = 0
+
+    def refresh(
+        self,
+        entries: list[dict[str, Any]],
+        trend: list[dict[str, Any]],
+        index: ForecastTimeIndex | None = None,
+        trend_index: ForecastTimeIndex | None = None,
+    ) -> tuple[ForecastDay, ...]:
+        if index is None:
+            index = ForecastTimeIndex(entries, shift=FORECAST_STEP_SHIFT)
+        if trend_index is None:
+            trend_index = ForecastTimeIndex(trend, index.tz, TREND_DAY_SHIFT)
+        inputs = _daily_inputs(entries, trend, index, trend_index)
+        days: dict[int, ForecastDay] = {}
+        recomputed = 0
+        for day_id in sorted(inputs):
+            source = inputs[day_id]
+            if _same_source(self._inputs.get(day_id), source):
+                days[day_id] = self._days[day_id]
+                continue
+            recomputed += 1
+            days[day_id] = _daily_forecast_day(day_id, source)
+        self._inputs = inputs
+        self._days = days
+        self.recomputed = recomputed
+        return tuple(days.values())
+
+
+def forecast_daily(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Aggregate forecast steps into one forecast dict per day."""
+    return [day.as_forecast() for day in forecast_days(entries)]
+
+
+def forecast_half_days(
+    entries: list[dict[str, Any]], index: ForecastTimeIndex | None = None
+) -> tuple[ForecastDay, ...]:
+    """Aggregate forecast steps into local day (06-18) and night (18-06) periods."""
+    if index is None:
+        index = ForecastTimeIndex(entries)
+    return tuple(
+        _aggregate(steps, index.half_start(half_id), half_id % 2 == 0)
+        for half_id, steps in _group(index.halves, entries).items()
+    )
+
+
+def forecast_twice_daily(
+    entries: list[dict[str, Any]], index: ForecastTimeIndex | None = None
+) -> list[dict[str, Any]]:
+    """Aggregate forecast steps into day and night forecast dicts."""
+    return [half.as_forecast() for half in forecast_half_days(entries, index)]
+
+
+def forecast_hourly(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Map the steps of the /advanced/1h forecast to one forecast dict per hour."""
+    symbols = WEATHER_SYMBOL_DICT
+    return [
+        {
+            "datetime": entry["dateTime"],
+            "condition": symbols.get(entry.get("weatherSymbol")),
+            "cloud_coverage": entry.get("cloudCoverage"),
+            "humidity": entry.get("humidityRelative"),
+            "native_dew_point": entry.get("dewpoint"),
+            "native_precipitation": entry.get("prec1h"),
+            "native_pressure": entry.get("pressureMsl"),
+            "native_temperature": entry.get("temp"),
+            "native_wind_gust_speed": entry.get("windGust"),
+            "native_wind_speed": entry.get("windSpeed"),
+            "wind_bearing": entry.get("windDirection"),
+        }
+        for entry in entries
+    ]
+
+
+def forecast_fingerprint(forecasts: list[dict[str, Any]]) -> int:
+    """Hash of a forecast view with floats rounded to one decimal."""
+    return hash(
+        tuple(
+            tuple(round(value, 1) if isinstance(value, float) else value for value in forecast.values())
+            for forecast in forecasts
+        )
+    )
+
+
+class ForecastSeries:
+    """Raw forecast steps with lazily computed forecast views.
+
+    Each view is built on first access and memoized for the lifetime of the
+    series; the coordinator creates a new series only when a payload changes.
+    ``days()`` returns the ForecastDay snapshots, ``daily()`` and friends the
+    Forecast dicts handed to Home Assistant. Days beyond the 6h horizon come
+    from the 14-day ``trend`` via a DailyForecastIndex shared across series.
+    Days and day/night periods are local to ``tz``; the bucket ids are
+    computed once per series and shared by all views. ``hourly_entries`` are
+    the steps of the /advanced/1h forecast, empty unless it was fetched.
+    """
+
+    __slots__ = ("entries", "trend", "hourly_entries", "tz", "_index", "_time_index", "_trend_index", "_views")
+
+    def __init__(
+        self,
+        entries: list[dict[str, Any]],
+        trend: list[dict[str, Any]] | None = None,
+        index: DailyForecastIndex | None = None,
+        tz: tzinfo | None = None,
+        hourly: list[dict[str, Any]] | None = None,
+    ) -> None:
+        self.entries = entries
+        self.trend = trend or []
+        self.hourly_entries = hourly or []
+        self.tz = tz
+        self._index = index
+        self._time_index: ForecastTimeIndex | None = None
+        self._trend_index: ForecastTimeIndex | None = None
+        self._views: dict[str, Any] = {}
+
+    def _view(self, name: str, build) -> Any:
+        view = self._views.get(name)
+        if view is None:
+            view = self._views[name] = build(self.entries)
+        return view
+
+    def time_index(self) -> ForecastTimeIndex:
+        if self._time_index is None:
+            self._time_index = ForecastTimeIndex(self.entries, self.tz, FORECAST_STEP_SHIFT)
+        return self._time_index
+
+    def trend_index(self) -> ForecastTimeIndex:
+        if self._trend_index is None:
+            self._trend_index = ForecastTimeIndex(self.trend, self.tz, TREND_DAY_SHIFT)
+        return self._trend_index
+
+    def days(self) -> tuple[ForecastDay, ...]:
+        if self._index is None and not self.trend:
+            return self._view("days", lambda entries: forecast_days(entries, self.time_index()))
+        if self._index is None:
+            self._index = DailyForecastIndex()
+        return self._view(
+            "days", lambda entries: self._index.refresh(entries, self.trend, self.time_index(), self.trend_index())
+        )
+
+    def day(self, day: date) -> ForecastDay | None:
+        """The ForecastDay of one local date, without building the whole daily view."""
+        if "days" in self._views:
+            key = day.isoformat()
+            return next((forecast_day for forecast_day in self._views["days"] if forecast_day.datetime == key), None)
+
+        def build(entries: list[dict[str, Any]]) -> ForecastDay | bool:
+            day_id = day.toordinal()
+            source = _daily_inputs(entries, self.trend, self.time_index(), self.trend_index()).get(day_id)
+            # False marks a date without data so the lookup is memoized too
+            return _daily_forecast_day(day_id, source) if source is not None else False
+
+        return self._view(f"day_{day.isoformat()}", build) or None
+
+    def daily(self) -> list[dict[str, Any]]:
+        return self._view("daily", lambda _entries: [day.as_forecast() for day in self.days()])
+
+    def twice_daily(self) -> list[dict[str, Any]]:
+        return self._view("twice_daily", lambda entries: forecast_twice_daily(entries, self.time_index()))
+
+    def hourly(self) -> list[dict[str, Any]]:
+        # Native 1h steps with their own timestamps; no bucketing needed
+        return self._view("hourly", lambda _entries: forecast_hourly(self.hourly_entries))
+
+    def fingerprint(self, forecast_type: str) -> int:
+        """Fingerprint of the ``daily``, ``twice_daily`` or ``hourly`` view."""
+        view = getattr(self, forecast_type)
+        return self._view(f"{forecast_type}_fingerprint", lambda _entries: forecast_fingerprint(view()))
+
+
+def normalize_forecasts(data: dict[str, Any]) -> ForecastSeries | None:
+    # This expecting data in 6h steps from /advanced/6h endpoint.
+    # Daily and twice-daily views are derived lazily from it.
+    if not data:
+        return None
+    return ForecastSeries(data.get("data", []))
+
+
+@dataclass(frozen=True, slots=True)
+class WeatherSnapshot:
+    """Coordinator data published to the entities after each update."""
+
+    current: CurrentConditions
+    forecast: ForecastSeries | None = None
+    # when the data was last fetched successfully; older while stale data is served
+    updated: datetime | None = None
@@ -0,0 +1,129 @@
+"""Lightweight request and update metrics for KachelmannWetter."""
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is open
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram."""
+
+    __slots__ = ("counts", "count", "total")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.counts[index] += 1
+                return
+        self.counts[-1] += 1
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+    def as_dict(self) -> dict[str, Any]:
+        labels = [f"<={bound}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"]
+        return {
+            "count": self.count,
+            "mean_seconds": self.mean,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class ClientMetrics:
+    """Counters collected by KachelmannClient."""
+
+    def __init__(self) -> None:
+        self.latency: dict[str, LatencyHistogram] = {}
+        self.status_counts: Counter[int] = Counter()
+        self.bytes_received = 0
+        self.rate_limited = 0
+        # fresh cache entries served without a request
+        self.cache_hits = 0
+        # revalidated with a 304 response
+        self.not_modified = 0
+        # full responses downloaded
+        self.cache_misses = 0
+        # callers that joined an identical in-flight request
+        self.coalesced = 0
+
+    @property
+    def requests(self) -> int:
+        return sum(self.status_counts.values())
+
+    @property
+    def cache_hit_ratio(self) -> float | None:
+        total = self.cache_hits + self.not_modified + self.cache_misses
+        return (self.cache_hits + self.not_modified) / total if total else None
+
+    def record_response(self, endpoint: str, status: int, seconds: float, size: int = 0) -> None:
+        histogram = self.latency.get(endpoint)
+        if histogram is None:
+            histogram = self.latency[endpoint] = LatencyHistogram()
+        histogram.observe(seconds)
+        self.status_counts[status] += 1
+        self.bytes_received += size
+        if status == 429:
+            self.rate_limited += 1
+        elif status == 304:
+            self.not_modified += 1
+        elif 200 <= status < 300:
+            self.cache_misses += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "status_counts": {str(status): count for status, count in self.status_counts.items()},
+            "bytes_received": self.bytes_received,
+            "rate_limited": self.rate_limited,
+            "cache_hits": self.cache_hits,
+            "not_modified": self.not_modified,
+            "cache_misses": self.cache_misses,
+            "cache_hit_ratio": self.cache_hit_ratio,
+            "coalesced": self.coalesced,
+            "latency": {endpoint: histogram.as_dict() for endpoint, histogram in self.latency.items()},
+        }
+
+
+class UpdateMetrics:
+    """Counters collected by the data update coordinator."""
+
+    def __init__(self) -> None:
+        self.updates = 0
+        self.failures = 0
+        # failed updates answered with the last good data
+        self.stale_updates = 0
+        self.effective_interval_seconds: float | None = None
+        self.weather_active: bool | None = None
+        self.normalizations = 0
+        self.last_normalization_seconds: float | None = None
+        self.total_normalization_seconds = 0.0
+
+    def record_normalization(self, seconds: float) -> None:
+        self.normalizations += 1
+        self.last_normalization_seconds = seconds
+        self.total_normalization_seconds += seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "updates": self.updates,
+            "failures": self.failures,
+            "stale_updates": self.stale_updates,
+            "effective_interval_seconds": self.effective_interval_seconds,
+            "weather_active": self.weather_active,
+            "normalizations": self.normalizations,
+            "last_normalization_seconds": self.last_normalization_seconds,
+            "mean_normalization_seconds": (
+                self.total_normalization_seconds / self.normalizations if self.normalizations else None
+            ),
+        }
@@ -0,0 +1,85 @@
+"""Opt-in cProfile hooks around the synchronous parts of an update."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+import contextlib
+import cProfile
+from pathlib import Path
+import pstats
+import time
+from typing import Any
+
+from .const import PROFILE_TOP_FUNCTIONS
+
+
+class _Section:
+    __slots__ = ("profile", "calls", "seconds")
+
+    def __init__(self) -> None:
+        self.profile = cProfile.Profile()
+        self.calls = 0
+        self.seconds = 0.0
+
+
+class SectionProfiler:
+    """Collects one cProfile profile per named code section while enabled.
+
+    Sections must not nest: only one profiler can be active at a time.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._sections: dict[str, _Section] = {}
+
+    @contextlib.contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section()
+        started = time.perf_counter()
+        section.profile.enable()
+        try:
+            yield
+        finally:
+            section.profile.disable()
+            section.calls += 1
+            section.seconds += time.perf_counter() - started
+
+    def reset(self) -> None:
+        self._sections.clear()
+
+    def dump(self, directory: Path | str) -> list[Path]:
+        """Write one ``<section>.prof`` file per section (for snakeviz, pstats, ...)."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for name, section in self._sections.items():
+            path = directory / f"{name}.prof"
+            section.profile.dump_stats(path)
+            paths.append(path)
+        return paths
+
+    def as_dict(self, limit: int = PROFILE_TOP_FUNCTIONS) -> dict[str, Any]:
+        """Wall time per section and its functions with the highest cumulative time."""
+        result = {}
+        for name, section in self._sections.items():
+            stats = pstats.Stats(section.profile).stats
+            top = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+            result[name] = {
+                "calls": section.calls,
+                "total_seconds": round(section.seconds, 6),
+                "mean_seconds": round(section.seconds / section.calls, 6) if section.calls else None,
+                "functions": [
+                    {
+                        "function": f"{Path(filename).name}:{line}({function})",
+                        "calls": calls,
+                        "own_seconds": round(own, 6),
+                        "cumulative_seconds": round(cumulative, 6),
+                    }
+                    for (filename, line, function), (_, calls, own, cumulative, _) in top
+                ],
+            }
+        return result
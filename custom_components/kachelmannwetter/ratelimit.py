@@ -0,0 +1,112 @@
+"""Shared token-bucket rate limiter for the KachelmannWetter API."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+
+from homeassistant.core import HomeAssistant
+
+from .exceptions import RateLimitError
+from .const import (
+    DEFAULT_RATE_LIMIT,
+    DOMAIN,
+    MAX_INTERVAL_STRETCH,
+    RATE_LIMIT_LOW_WATERMARK,
+    RATE_LIMIT_PERIOD,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_RATE_LIMITERS = "rate_limiters"
+
+
+def _header_int(headers, name: str) -> int | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """Token bucket shared by every client using one API key.
+
+    Requests wait for a token instead of failing with 429; the bucket is kept in
+    sync with the quota the API reports in its ``x-ratelimit-*`` headers.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_RATE_LIMIT, period: float = RATE_LIMIT_PERIOD) -> None:
+        self.capacity = capacity
+        self.period = period
+        self.remaining: int | None = None
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.capacity / self.period)
+
+    async def async_acquire(self) -> None:
+        """Wait until a request may be sent and consume one token.
+
+        Raises RateLimitError without waiting while the API has blocked us.
+        """
+        # The lock queues waiters so refreshes of many entries are spread out
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    raise RateLimitError("Rate limit exhausted", retry_after=math.ceil(self._blocked_until - now))
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.period / self.capacity
+                _LOGGER.debug("Rate limit budget exhausted, waiting %.1fs", wait)
+                await asyncio.sleep(wait)
+
+    def block(self, seconds: float | None) -> None:
+        """Hold back all requests for ``seconds`` (after a 429)."""
+        self._tokens = 0.0
+        if seconds:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def update_from_headers(self, headers) -> None:
+        """Synchronize the bucket with the quota reported by the API."""
+        limit = _header_int(headers, "x-ratelimit-limit")
+        remaining = _header_int(headers, "x-ratelimit-remaining")
+        if limit and limit != self.capacity:
+            _LOGGER.debug("Rate limit capacity updated from %s to %s", self.capacity, limit)
+            self.capacity = limit
+        if remaining is None:
+            return
+        self.remaining = remaining
+        self._refill(time.monotonic())
+        self._tokens = min(self._tokens, float(remaining))
+        if remaining <= 0:
+            self.block(_header_int(headers, "x-ratelimit-reset") or _header_int(headers, "x-ratelimit-retry-after"))
+
+    @property
+    def interval_factor(self) -> float:
+        """Factor by which polling intervals should be stretched to save quota."""
+        if self.remaining is None or not self.capacity:
+            return 1.0
+        ratio = self.remaining / self.capacity
+        if ratio >= RATE_LIMIT_LOW_WATERMARK:
+            return 1.0
+        return min(float(MAX_INTERVAL_STRETCH), RATE_LIMIT_LOW_WATERMARK / max(ratio, 1e-3))
+
+
+def get_rate_limiter(hass: HomeAssistant, api_key: str) -> RateLimiter:
+    """Return the limiter shared by all config entries using ``api_key``."""
+    limiters: dict[str, RateLimiter] = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_RATE_LIMITERS, {})
+    if api_key not in limiters:
+        limiters[api_key] = RateLimiter()
+    return limiters[api_key]
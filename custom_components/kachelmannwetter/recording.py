@@ -0,0 +1,161 @@
+"""Record raw API responses to disk and replay them without network access.
+
+Recordings are gzip-compressed JSON lines, one response per line::
+
+    {"t": 12.5, "path": "/current/52.52/13.41", "status": 200, "elapsed": 0.21,
+     "headers": {...}, "body": "..."}
+
+``t`` is the offset from the start of the recording and ``path`` the URL
+relative to the client's base URL, so a recording can be replayed against any
+base URL.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import gzip
+import json
+import logging
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+from aiohttp import ClientResponseError, RequestInfo
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from .const import RECORDING_MAX_BYTES
+from .exceptions import KachelmannError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RecordedResponse:
+    """Stand-in for an aiohttp response with the body already read."""
+
+    __slots__ = ("url", "status", "headers", "body", "elapsed")
+
+    def __init__(self, url: str, status: int, headers: dict[str, str], body: bytes, elapsed: float) -> None:
+        self.url = url
+        self.status = status
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self.body = body
+        self.elapsed = elapsed
+
+    async def read(self) -> bytes:
+        return self.body
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            url = URL(self.url)
+            raise ClientResponseError(
+                RequestInfo(url, "GET", CIMultiDictProxy(CIMultiDict()), url),
+                (),
+                status=self.status,
+                headers=self.headers,
+            )
+
+
+def _encode(offset: float, path: str, response: RecordedResponse) -> bytes:
+    record = {
+        "t": round(offset, 3),
+        "path": path,
+        "status": response.status,
+        "elapsed": round(response.elapsed, 4),
+        "headers": dict(response.headers),
+        # surrogateescape keeps non-UTF-8 bodies byte-exact through JSON
+        "body": response.body.decode("utf-8", "surrogateescape"),
+    }
+    return json.dumps(record, separators=(",", ":")).encode() + b"\n"
+
+
+class HttpRecorder:
+    """Appends every response received by a client to a recording file.
+
+    Once the file reaches ``max_bytes`` it is moved to ``<name>.1.jsonl.gz``,
+    replacing the previous one, and recording continues in a new file.
+    """
+
+    def __init__(self, hass, path: Path | str, max_bytes: int = RECORDING_MAX_BYTES) -> None:
+        self._hass = hass
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.responses = 0
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _write(self, line: bytes) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Each write appends a gzip member; readers see one continuous stream
+            with gzip.open(self.path, "ab") as file:
+                file.write(line)
+            if self.path.stat().st_size >= self.max_bytes:
+                self.path.replace(self.backup_path)
+                _LOGGER.debug("Rotated recording %s to %s", self.path, self.backup_path)
+
+    @property
+    def backup_path(self) -> Path:
+        return self.path.with_name(f"{self.path.name.removesuffix('.jsonl.gz')}.1.jsonl.gz")
+
+    async def async_record(self, url: str, path: str, resp, started: float) -> RecordedResponse:
+        """Read ``resp`` completely, store it and return a replayable copy."""
+        body = await resp.read()
+        response = RecordedResponse(url, resp.status, dict(resp.headers), body, time.monotonic() - started)
+        line = _encode(started - self._started, path, response)
+        await self._hass.async_add_executor_job(self._write, line)
+        self.responses += 1
+        return response
+
+
+class HttpReplay:
+    """Serves recorded responses in recorded order per path.
+
+    Once the responses of a path are used up its last response is repeated.
+    ``speed`` scales the recorded response times: 1 replays at recorded speed,
+    10 ten times faster and 0 without any delay.
+    """
+
+    def __init__(self, records: Iterable[dict[str, Any]], speed: float = 1.0) -> None:
+        self.speed = speed
+        self._responses: dict[str, list[RecordedResponse]] = {}
+        self._positions: dict[str, int] = {}
+        for record in records:
+            self._responses.setdefault(record["path"], []).append(
+                RecordedResponse(
+                    record["path"],
+                    record["status"],
+                    record["headers"],
+                    record["body"].encode("utf-8", "surrogateescape"),
+                    record["elapsed"],
+                )
+            )
+
+    @classmethod
+    def load(cls, path: Path | str, speed: float = 1.0) -> HttpReplay:
+        """Read a recording; blocking, call from an executor inside Home Assistant."""
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            return cls((json.loads(line) for line in file if line.strip()), speed)
+
+    @property
+    def paths(self) -> list[str]:
+        return list(self._responses)
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._responses.values())
+
+    async def async_response(self, url: str, path: str) -> RecordedResponse:
+        responses = self._responses.get(path)
+        if not responses:
+            raise KachelmannError(f"No recorded response for {path}")
+        position = self._positions.get(path, 0)
+        self._positions[path] = position + 1
+        response = responses[min(position, len(responses) - 1)]
+        if self.speed:
+            await asyncio.sleep(response.elapsed / self.speed)
+        else:
+            # still yield so concurrent callers interleave as they would on the wire
+            await asyncio.sleep(0)
+        _LOGGER.debug("Replaying %s (%s) for %s", path, response.status, url)
+        return response
@@ -0,0 +1,89 @@
+"""Retry backoff and circuit breaker for KachelmannWetter API requests."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import random
+import time
+
+from aiohttp import ClientConnectionError, ClientPayloadError, ClientResponseError
+
+from .const import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def is_transient(err: BaseException) -> bool:
+    """Return True for errors worth retrying: timeouts, connection problems and 5xx."""
+    if isinstance(err, ClientResponseError):
+        return err.status >= 500
+    return isinstance(err, (asyncio.TimeoutError, ClientConnectionError, ClientPayloadError))
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given (0-based) retry."""
+    return random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2**attempt))
+
+
+class CircuitBreaker:
+    """Fails fast after repeated failures until a trial request succeeds."""
+
+    def __init__(self, threshold: int = CIRCUIT_FAILURE_THRESHOLD, reset_timeout: float = CIRCUIT_RESET_TIMEOUT) -> None:
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: float | None = None
+        # A trial request is in flight; everybody else keeps failing fast
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        return "half_open" if self.retry_after == 0 else "open"
+
+    @property
+    def retry_after(self) -> int:
+        """Seconds until a trial request is allowed (0 when allowed now)."""
+        if self._opened_at is None:
+            return 0
+        return max(0, math.ceil(self._opened_at + self.reset_timeout - time.monotonic()))
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent.
+
+        Once the cool-down has passed a single caller is let through as the
+        trial request; the others are held until it succeeds or fails.
+        """
+        if self._opened_at is None:
+            return True
+        if self._probing or self.retry_after > 0:
+            return False
+        self._probing = True
+        return True
+
+    def release(self) -> None:
+        """End a trial request that neither succeeded nor failed, e.g. on a 4xx."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            _LOGGER.info("KachelmannWetter API reachable again, closing circuit")
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+        if self.failures >= self.threshold:
+            if self._opened_at is None:
+                _LOGGER.warning("KachelmannWetter API failing, pausing requests for %ss", self.reset_timeout)
+            # (Re)open; a failed trial request restarts the cool-down
+            self._opened_at = time.monotonic()
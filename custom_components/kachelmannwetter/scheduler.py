@@ -0,0 +1,259 @@
+"""Single refresh loop for all locations of a KachelmannWetter config entry."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+from logging import Logger, getLogger
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er, issue_registry as ir
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_API_KEY,
+    CONF_LATITUDE,
+    CONF_LOCATION_ID,
+    CONF_LOCATIONS,
+    CONF_LONGITUDE,
+    CONF_NAME,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_MAX_STALE_AGE,
+    DEFAULT_PROFILE_UPDATES,
+    DEFAULT_RECORD_RESPONSES,
+    DEFAULT_SNAP_TO_GRID,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    MAX_CONCURRENT_LOCATIONS,
+    OPTION_ADAPTIVE_POLLING,
+    OPTION_MAX_STALE_AGE,
+    OPTION_PROFILE_UPDATES,
+    OPTION_RECORD_RESPONSES,
+    OPTION_SNAP_TO_GRID,
+    OPTION_UPDATE_INTERVAL,
+    RECORDING_DIR,
+    SCHEDULER_TICK,
+    STORAGE_VERSION,
+)
+from .client import get_client
+from .coordinator import KachelmannDataUpdateCoordinator
+from .exceptions import InvalidAuth
+from .profiling import SectionProfiler
+from .recording import HttpRecorder
+
+_LOGGER: Logger = getLogger(__package__)
+
+# Key of the location stored in the entry data
+PRIMARY_LOCATION = ""
+
+EntityFactory = Callable[[KachelmannDataUpdateCoordinator], list[Entity]]
+
+
+def entry_locations(entry: ConfigEntry) -> dict[str, dict[str, Any]]:
+    """Locations of an entry by id, starting with the one from the entry data."""
+    locations = {
+        PRIMARY_LOCATION: {
+            CONF_LATITUDE: entry.data.get(CONF_LATITUDE),
+            CONF_LONGITUDE: entry.data.get(CONF_LONGITUDE),
+        }
+    }
+    for location in entry.options.get(CONF_LOCATIONS, []):
+        locations[location[CONF_LOCATION_ID]] = location
+    return locations
+
+
+def entry_settings(entry: ConfigEntry) -> dict[str, Any]:
+    """Options that apply to every location; changing them reloads the entry."""
+    return {key: value for key, value in entry.options.items() if key != CONF_LOCATIONS}
+
+
+class LocationScheduler:
+    """Refreshes the coordinators of all locations of an entry from one timer.
+
+    Every tick refreshes the locations whose polling interval has elapsed, at
+    most MAX_CONCURRENT_LOCATIONS at a time. Coordinators keep their own
+    interval logic (adaptive polling, rate-limit stretching) but run no timer.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        self.hass = hass
+        self.entry = entry
+        self.settings = entry_settings(entry)
+        self.coordinators: dict[str, KachelmannDataUpdateCoordinator] = {}
+        self._next_refresh: dict[str, datetime] = {}
+        self._refreshing: set[str] = set()
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOCATIONS)
+        self._platforms: list[tuple[EntityFactory, AddEntitiesCallback]] = []
+        # Locations whose entities were handed to every registered platform
+        self._with_entities: set[str] = set()
+        self._unsub_tick: CALLBACK_TYPE | None = None
+        # Shared by the coordinators of all locations of the entry
+        self.profiler = SectionProfiler(entry.options.get(OPTION_PROFILE_UPDATES, DEFAULT_PROFILE_UPDATES))
+
+    def _create_coordinator(self, location_id: str, location: dict[str, Any]) -> KachelmannDataUpdateCoordinator:
+        options = self.entry.options
+        coordinator = KachelmannDataUpdateCoordinator(
+            self.hass,
+            self.entry.data.get(CONF_API_KEY),
+            location[CONF_LATITUDE],
+            location[CONF_LONGITUDE],
+            update_interval_seconds=options.get(OPTION_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+            entry_id=self.entry.entry_id,
+            adaptive_polling=options.get(OPTION_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING),
+            max_stale_age=options.get(OPTION_MAX_STALE_AGE, DEFAULT_MAX_STALE_AGE),
+            location_id=location_id or None,
+            location_name=location.get(CONF_NAME),
+            external_schedule=True,
+            profiler=self.profiler,
+            snap=options.get(OPTION_SNAP_TO_GRID, DEFAULT_SNAP_TO_GRID),
+        )
+        self.coordinators[location_id] = coordinator
+        return coordinator
+
+    async def async_setup(self) -> None:
+        """Create the coordinators, warm-start them and fetch the rest.
+
+        Raises ConfigEntryNotReady when no location has any data.
+        """
+        now = dt_util.utcnow()
+        self._setup_recording(now)
+        missing = []
+        stale = []
+        for location_id, location in entry_locations(self.entry).items():
+            coordinator = self._create_coordinator(location_id, location)
+            restored = await coordinator.async_restore()
+            if restored is None:
+                missing.append(location_id)
+                continue
+            # Warm start: entities come up from the stored snapshot and the API
+            # is kept off the boot critical path
+            data, updated = restored
+            coordinator.async_set_updated_data(data)
+            self._next_refresh[location_id] = updated + coordinator.poll_interval
+            if self._next_refresh[location_id] <= now:
+                stale.append(location_id)
+
+        if missing:
+            await self._async_refresh(missing)
+            failed = [self.coordinators[location_id] for location_id in missing]
+            if all(coordinator.data is None for coordinator in self.coordinators.values()):
+                if any(isinstance(coordinator.last_exception, InvalidAuth) for coordinator in failed):
+                    raise ConfigEntryAuthFailed from failed[0].last_exception
+                raise ConfigEntryNotReady from failed[0].last_exception
+        if stale:
+            self.entry.async_create_background_task(
+                self.hass, self._async_refresh(stale), f"{DOMAIN} refresh {self.entry.entry_id}"
+            )
+        self._unsub_tick = async_track_time_interval(
+            self.hass, self._async_tick, timedelta(seconds=SCHEDULER_TICK), name=f"{DOMAIN} scheduler"
+        )
+
+    def _setup_recording(self, now: datetime) -> None:
+        # The client is shared per API key; only this entry's recorder is touched
+        if not self.entry.options.get(OPTION_RECORD_RESPONSES, DEFAULT_RECORD_RESPONSES):
+            return
+        client = get_client(self.hass, self.entry.data.get(CONF_API_KEY))
+        path = self.hass.config.path(RECORDING_DIR, f"{now:%Y%m%dT%H%M%S}_{self.entry.entry_id}.jsonl.gz")
+        _LOGGER.info("Recording KachelmannWetter API responses to %s", path)
+        client.recorders[self.entry.entry_id] = HttpRecorder(self.hass, path)
+
+    async def async_shutdown(self) -> None:
+        if self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
+        get_client(self.hass, self.entry.data.get(CONF_API_KEY)).recorders.pop(self.entry.entry_id, None)
+        for coordinator in self.coordinators.values():
+            await coordinator.async_shutdown()
+
+    async def _async_tick(self, now: datetime) -> None:
+        due = [
+            location_id
+            for location_id, refresh_at in self._next_refresh.items()
+            if (refresh_at <= now or self.coordinators[location_id].refresh_requested)
+            and location_id not in self._refreshing
+        ]
+        if due:
+            _LOGGER.debug("Refreshing %s of %s locations", len(due), len(self.coordinators))
+            await self._async_refresh(due)
+
+    async def _async_refresh(self, location_ids: Iterable[str]) -> None:
+        location_ids = set(location_ids)
+        self._refreshing |= location_ids
+        try:
+            await asyncio.gather(*(self._async_refresh_location(location_id) for location_id in location_ids))
+        finally:
+            self._refreshing -= location_ids
+
+    async def _async_refresh_location(self, location_id: str) -> None:
+        async with self._semaphore:
+            coordinator = self.coordinators.get(location_id)
+            if coordinator is None:
+                # removed while waiting for a slot
+                return
+            await coordinator.async_refresh()
+        if self.coordinators.get(location_id) is not coordinator:
+            return
+        # A rate-limited or circuit-broken update is retried when the API allows
+        delay = timedelta(seconds=coordinator.retry_after) if coordinator.retry_after else coordinator.poll_interval
+        self._next_refresh[location_id] = dt_util.utcnow() + delay
+        if coordinator.data is not None and location_id not in self._with_entities and self._platforms:
+            self._add_entities(location_id, self._platforms)
+
+    @callback
+    def _add_entities(self, location_id: str, platforms: list[tuple[EntityFactory, AddEntitiesCallback]]) -> None:
+        coordinator = self.coordinators[location_id]
+        for factory, async_add_entities in platforms:
+            async_add_entities(factory(coordinator))
+        self._with_entities.add(location_id)
+
+    @callback
+    def async_add_platform(self, factory: EntityFactory, async_add_entities: AddEntitiesCallback) -> None:
+        """Register a platform.
+
+        Entities are created for every location with data now, and for other
+        locations once their first refresh succeeds.
+        """
+        self._platforms.append((factory, async_add_entities))
+        for location_id, coordinator in self.coordinators.items():
+            if coordinator.data is not None:
+                self._add_entities(location_id, [(factory, async_add_entities)])
+
+    async def async_update_locations(self, locations: dict[str, dict[str, Any]]) -> None:
+        """Add and remove locations without reloading the entry."""
+        for location_id in self.coordinators.keys() - locations.keys():
+            await self._async_remove_location(location_id)
+        added = [location_id for location_id in locations if location_id not in self.coordinators]
+        for location_id in added:
+            self._create_coordinator(location_id, locations[location_id])
+        if added:
+            _LOGGER.debug("Adding %s locations to entry %s", len(added), self.entry.entry_id)
+            self.entry.async_create_background_task(
+                self.hass, self._async_refresh(added), f"{DOMAIN} refresh {self.entry.entry_id}"
+            )
+
+    async def _async_remove_location(self, location_id: str) -> None:
+        coordinator = self.coordinators.pop(location_id)
+        self._next_refresh.pop(location_id, None)
+        self._with_entities.discard(location_id)
+        await coordinator.async_shutdown()
+        # Removing the registry entries also removes the entities
+        registry = er.async_get(self.hass)
+        prefix = f"{coordinator.unique_prefix}_"
+        for registry_entry in er.async_entries_for_config_entry(registry, self.entry.entry_id):
+            if registry_entry.unique_id.startswith(prefix):
+                registry.async_remove(registry_entry.entity_id)
+        await async_remove_location_data(self.hass, coordinator.unique_prefix)
+        _LOGGER.debug("Removed location %s from entry %s", location_id, self.entry.entry_id)
+
+
+async def async_remove_location_data(hass: HomeAssistant, unique_prefix: str) -> None:
+    """Remove the stored snapshot, backfill checkpoint and repair issue of a location."""
+    ir.async_delete_issue(hass, DOMAIN, f"stale_data_{unique_prefix}")
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{unique_prefix}").async_remove()
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{unique_prefix}.backfill").async_remove()
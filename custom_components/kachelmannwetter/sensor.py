@@ -0,0 +1,273 @@
+"""Sensor platform for KachelmannWetter integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from logging import Logger, getLogger
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfPrecipitationDepth,
+    UnitOfPressure,
+    UnitOfSpeed,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DEFAULT_SENSOR_TOLERANCE, DOMAIN, OPTION_SENSOR_TOLERANCE
+from .helpers import ForecastDay
+
+_LOGGER: Logger = getLogger(__package__)
+
+
+def _ms(seconds: float | None) -> float | None:
+    return round(seconds * 1000, 2) if seconds is not None else None
+
+
+def _mean_latency(coordinator) -> float | None:
+    histograms = coordinator.client.metrics.latency.values()
+    count = sum(histogram.count for histogram in histograms)
+    return _ms(sum(histogram.total for histogram in histograms) / count) if count else None
+
+
+def _today(coordinator) -> ForecastDay | None:
+    # Only today's day is aggregated and it is memoized on the series, so the
+    # full daily view stays lazy
+    series = coordinator.data.forecast
+    return series.day(dt_util.now().date()) if series is not None else None
+
+
+def _cache_hit_ratio(coordinator) -> float | None:
+    ratio = coordinator.client.metrics.cache_hit_ratio
+    return round(ratio * 100, 1) if ratio is not None else None
+
+
+@dataclass(frozen=True, kw_only=True)
+class KachelmannSensorEntityDescription(SensorEntityDescription):
+    value_fn: Callable[[Any], Any]
+    # Change in native units per step of the sensor tolerance option
+    tolerance: float = 0.0
+
+
+WEATHER_SENSORS: tuple[KachelmannSensorEntityDescription, ...] = (
+    KachelmannSensorEntityDescription(
+        key="temperature",
+        name="Temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        tolerance=0.1,
+        value_fn=lambda coordinator: coordinator.data.current.temperature,
+    ),
+    KachelmannSensorEntityDescription(
+        key="dew_point",
+        name="Dew point",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        tolerance=0.1,
+        value_fn=lambda coordinator: coordinator.data.current.dew_point,
+    ),
+    KachelmannSensorEntityDescription(
+        key="wind_gust",
+        name="Wind gust",
+        device_class=SensorDeviceClass.WIND_SPEED,
+        native_unit_of_measurement=UnitOfSpeed.METERS_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        tolerance=0.5,
+        value_fn=lambda coordinator: coordinator.data.current.wind_gust,
+    ),
+    KachelmannSensorEntityDescription(
+        key="precipitation_1h",
+        name="Precipitation 1h",
+        device_class=SensorDeviceClass.PRECIPITATION,
+        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
+        state_class=SensorStateClass.MEASUREMENT,
+        tolerance=0.1,
+        value_fn=lambda coordinator: coordinator.data.current.precipitation_1h,
+    ),
+    KachelmannSensorEntityDescription(
+        key="pressure",
+        name="Pressure",
+        device_class=SensorDeviceClass.ATMOSPHERIC_PRESSURE,
+        native_unit_of_measurement=UnitOfPressure.HPA,
+        state_class=SensorStateClass.MEASUREMENT,
+        tolerance=0.5,
+        value_fn=lambda coordinator: coordinator.data.current.pressure,
+    ),
+    KachelmannSensorEntityDescription(
+        key="forecast_temperature_high",
+        name="Forecast temperature high",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        tolerance=0.1,
+        value_fn=lambda coordinator: (day := _today(coordinator)) and day.native_temperature,
+    ),
+    KachelmannSensorEntityDescription(
+        key="forecast_temperature_low",
+        name="Forecast temperature low",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        tolerance=0.1,
+        value_fn=lambda coordinator: (day := _today(coordinator)) and day.native_templow,
+    ),
+    KachelmannSensorEntityDescription(
+        key="forecast_precipitation",
+        name="Forecast precipitation",
+        device_class=SensorDeviceClass.PRECIPITATION,
+        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
+        state_class=SensorStateClass.MEASUREMENT,
+        tolerance=0.1,
+        value_fn=lambda coordinator: (day := _today(coordinator)) and day.native_precipitation,
+    ),
+    KachelmannSensorEntityDescription(
+        key="forecast_wind_gust",
+        name="Forecast wind gust",
+        device_class=SensorDeviceClass.WIND_SPEED,
+        native_unit_of_measurement=UnitOfSpeed.METERS_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        tolerance=0.5,
+        value_fn=lambda coordinator: (day := _today(coordinator)) and day.native_wind_gust_speed,
+    ),
+)
+
+DIAGNOSTIC_SENSORS: tuple[KachelmannSensorEntityDescription, ...] = (
+    KachelmannSensorEntityDescription(
+        key="api_requests",
+        name="API requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.client.metrics.requests,
+    ),
+    KachelmannSensorEntityDescription(
+        key="rate_limited_requests",
+        name="Rate limited requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.client.metrics.rate_limited,
+    ),
+    KachelmannSensorEntityDescription(
+        key="rate_limit_remaining",
+        name="Rate limit remaining",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.rate_limiter.remaining,
+    ),
+    KachelmannSensorEntityDescription(
+        key="cache_hit_ratio",
+        name="Cache hit ratio",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_cache_hit_ratio,
+    ),
+    KachelmannSensorEntityDescription(
+        key="api_latency",
+        name="API latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_mean_latency,
+    ),
+    KachelmannSensorEntityDescription(
+        key="last_successful_update",
+        name="Last successful update",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda coordinator: coordinator.data.updated,
+    ),
+    KachelmannSensorEntityDescription(
+        key="update_interval",
+        name="Update interval",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.metrics.effective_interval_seconds,
+    ),
+    KachelmannSensorEntityDescription(
+        key="normalization_time",
+        name="Normalization time",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: _ms(coordinator.metrics.last_normalization_seconds),
+    ),
+)
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
+    scheduler = hass.data[DOMAIN][entry.entry_id]
+    _LOGGER.debug("Adding KachelmannWetter sensors for entry %s", entry.entry_id)
+    tolerance = entry.options.get(OPTION_SENSOR_TOLERANCE, DEFAULT_SENSOR_TOLERANCE)
+
+    def location_sensors(coordinator) -> list[SensorEntity]:
+        entities: list[SensorEntity] = [
+            KachelmannSensor(coordinator, description, tolerance) for description in WEATHER_SENSORS
+        ]
+        entities.extend(KachelmannDiagnosticSensor(coordinator, description) for description in DIAGNOSTIC_SENSORS)
+        return entities
+
+    scheduler.async_add_platform(location_sensors, async_add_entities)
+
+
+def _changed(old: Any, new: Any, tolerance: float) -> bool:
+    if old is None or new is None or not isinstance(new, (int, float)) or not isinstance(old, (int, float)):
+        return old != new
+    return abs(new - old) > tolerance
+
+
+class KachelmannSensor(CoordinatorEntity, SensorEntity):
+    """Weather value that only writes state when it actually changed."""
+
+    entity_description: KachelmannSensorEntityDescription
+
+    def __init__(self, coordinator, description: KachelmannSensorEntityDescription, tolerance: float) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._tolerance = tolerance * description.tolerance
+        self._attr_name = f"{coordinator.display_name} {description.name}"
+        self._attr_unique_id = f"{coordinator.unique_prefix}_{description.key}"
+        self._attr_native_value = description.value_fn(coordinator)
+        self._last_available = coordinator.last_update_success
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        value = self.entity_description.value_fn(self.coordinator)
+        available = self.available
+        # Compare against the last written value so slow drift still surfaces
+        if available == self._last_available and not _changed(self._attr_native_value, value, self._tolerance):
+            return
+        self._attr_native_value = value
+        self._last_available = available
+        self.async_write_ha_state()
+
+
+class KachelmannDiagnosticSensor(CoordinatorEntity, SensorEntity):
+    """Request/update metric, disabled by default."""
+
+    entity_description: KachelmannSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator, description: KachelmannSensorEntityDescription) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_name = f"{coordinator.display_name} {description.name}"
+        self._attr_unique_id = f"{coordinator.unique_prefix}_{description.key}"
+
+    @property
+    def available(self) -> bool:
+        # Metrics stay meaningful while the API is failing
+        return True
+
+    @property
+    def native_value(self) -> Any:
+        return self.entity_description.value_fn(self.coordinator)
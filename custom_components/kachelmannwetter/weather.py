@@ -4,39 +4,76 @@ from __future__ import annotations
 from typing import Any
 from logging import Logger, getLogger
 
-from homeassistant.components.weather import WeatherEntity, WeatherEntityFeature
-from homeassistant.const import ATTR_ATTRIBUTION
-from homeassistant.core import HomeAssistant
+from homeassistant.components.weather import Forecast, WeatherEntity, WeatherEntityFeature
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, DEFAULT_NAME
-from .helpers import WEATHER_SYMBOL_DICT
+from .const import DOMAIN
 
 _LOGGER: Logger = getLogger(__package__)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
-    coordinator = hass.data[DOMAIN][entry.entry_id]
-    _LOGGER.debug("Adding KachelmannWeather entity for entry %s", entry.entry_id)
-    async_add_entities([KachelmannWeather(coordinator)])
+    scheduler = hass.data[DOMAIN][entry.entry_id]
+    _LOGGER.debug("Adding KachelmannWeather entities for entry %s", entry.entry_id)
+    # One weather entity per location, added once the location has data
+    scheduler.async_add_platform(lambda coordinator: [KachelmannWeather(coordinator)], async_add_entities)
 
 
 class KachelmannWeather(CoordinatorEntity, WeatherEntity):
     def __init__(self, coordinator) -> None:
         super().__init__(coordinator)
         self.coordinator = coordinator
-        self._attr_name = DEFAULT_NAME
+        self._attr_name = coordinator.display_name
+        self._attr_unique_id = f"{coordinator.unique_prefix}_weather"
+        # Fingerprint of the forecast last handed out, per type. Home Assistant
+        # only asks for the types that have subscribers, so these are the
+        # types worth checking for changes.
+        self._forecast_fingerprints: dict[str, int | None] = {}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        super()._handle_coordinator_update()
+        # Only views handed out before are built; unchanged ones are not re-sent
+        series = self.coordinator.data.forecast
+        changed = [
+            forecast_type
+            for forecast_type, last in self._forecast_fingerprints.items()
+            if (series.fingerprint(forecast_type) if series is not None else None) != last
+        ]
+        if changed:
+            _LOGGER.debug("Forecast changed for %s, notifying subscribers", changed)
+            # Home Assistant only fetches the types that still have subscribers,
+            # which re-adds them; the others are no longer tracked
+            for forecast_type in changed:
+                del self._forecast_fingerprints[forecast_type]
+            self.hass.async_create_task(self.async_update_listeners(changed))
+
+    @callback
+    def _async_subscription_started(self, forecast_type: str) -> None:
+        # The 1h forecast costs an extra request, so it is only fetched while
+        # someone subscribes to it
+        if forecast_type == "hourly":
+            self.coordinator.async_set_hourly_wanted(True)
+
+    @callback
+    def _async_subscription_ended(self, forecast_type: str) -> None:
+        if forecast_type == "hourly":
+            self.coordinator.async_set_hourly_wanted(False)
 
     @property
     def supported_features(self) -> WeatherEntityFeature:
-        return WeatherEntityFeature.FORECAST_DAILY
+        return (
+            WeatherEntityFeature.FORECAST_DAILY
+            | WeatherEntityFeature.FORECAST_TWICE_DAILY
+            | WeatherEntityFeature.FORECAST_HOURLY
+        )
 
     @property
     def condition(self) -> str | None:
-        current = (self.coordinator.data or {}).get("current") or {}
-        cond = current.get("condition")
+        cond = self.coordinator.data.current.condition
         if not cond:
             return None
         _LOGGER.debug("Condition = %s", cond)
@@ -44,8 +81,7 @@ class KachelmannWeather(CoordinatorEntity, WeatherEntity):
 
     @property
     def native_temperature(self) -> float | None:
-        current = (self.coordinator.data or {}).get("current") or {}
-        return current.get("temperature")
+        return self.coordinator.data.current.temperature
 
     @property
     def native_temperature_unit(self) -> str | None:
@@ -53,13 +89,11 @@ class KachelmannWeather(CoordinatorEntity, WeatherEntity):
 
     @property
     def humidity(self) -> int | None:
-        current = (self.coordinator.data or {}).get("current") or {}
-        return current.get("humidity")
+        return self.coordinator.data.current.humidity
 
     @property
     def native_pressure(self) -> int | None:
-        current = (self.coordinator.data or {}).get("current") or {}
-        return current.get("pressure")
+        return self.coordinator.data.current.pressure
 
     @property
     def native_pressure_unit(self) -> str | None:
@@ -67,8 +101,7 @@ class KachelmannWeather(CoordinatorEntity, WeatherEntity):
 
     @property
     def native_wind_speed(self) -> float | None:
-        current = (self.coordinator.data or {}).get("current") or {}
-        return current.get("wind_speed")
+        return self.coordinator.data.current.wind_speed
 
     @property
     def native_wind_speed_unit(self) -> str | None:
@@ -76,20 +109,35 @@ class KachelmannWeather(CoordinatorEntity, WeatherEntity):
 
     @property
     def native_wind_gust(self) -> float | None:
-        current = (self.coordinator.data or {}).get("current") or {}
-        return current.get("wind_gust")
+        return self.coordinator.data.current.wind_gust
 
     @property
     def wind_bearing(self) -> int | None:
-        current = (self.coordinator.data or {}).get("current") or {}
-        return current.get("wind_bearing")
+        return self.coordinator.data.current.wind_bearing
 
     @property
     def attribution(self) -> str | None:
         return "Data provided by KachelmannWetter"
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        # Set while failed updates are answered with the last good data
+        return {"stale": self.coordinator.serving_stale}
+
+    def _forecast(self, forecast_type: str) -> list[Forecast] | None:
+        series = self.coordinator.data.forecast
+        if series is None:
+            self._forecast_fingerprints[forecast_type] = None
+            return None
+        self._forecast_fingerprints[forecast_type] = series.fingerprint(forecast_type)
+        return getattr(series, forecast_type)()
+
     async def async_forecast_daily(self) -> list[Forecast] | None:
-        # This is using the 14day trend forecast endpoint
-        forecasts: list[dict[str, Any]] = []
-        data = (self.coordinator.data or {}).get("forecast") or {}
-        return data.get("daily")
\ No newline at end of file
+        return self._forecast("daily")
+
+    async def async_forecast_twice_daily(self) -> list[Forecast] | None:
+        return self._forecast("twice_daily")
+
+    async def async_forecast_hourly(self) -> list[Forecast] | None:
+        # Empty until the first 1h forecast after the subscription arrived
+        return self._forecast("hourly") or None
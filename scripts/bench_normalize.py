@@ -0,0 +1,105 @@
+"""Micro-benchmark for the daily forecast aggregation in helpers.
+
+Compares the single-pass aggregation in helpers.forecast_daily against the
+original list-based normalize_forecasts on a large forecast payload and checks
+both agree.
+
+    python scripts/bench_normalize.py [--days 14] [--step 1] [--repeat 200]
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import date, datetime
+import timeit
+
+from payloads import forecast_payload, load_component_module
+
+helpers = load_component_module("helpers")
+WEATHER_SYMBOL_DICT = helpers.WEATHER_SYMBOL_DICT
+
+
+def legacy_normalize_forecasts(data):
+    """normalize_forecasts as it was originally implemented."""
+    if not data:
+        return {}
+    out = {"daily": []}
+    daily_data: dict[date, dict] = {}
+    for entry in data.get("data", []):
+        date_key = datetime.fromisoformat(entry["dateTime"]).date()
+        timeofday = datetime.fromisoformat(entry["dateTime"]).time()
+        if date_key not in daily_data:
+            daily_data[date_key] = {
+                "cloud_coverage": [],
+                "condition": set(),
+                "humidity": [],
+                "native_dew_point": [],
+                "native_precipitation": [],
+                "native_pressure": [],
+                "native_temperature": [],
+                "native_templow": [],
+                "native_wind_gust_speed": [],
+                "native_wind_speed": [],
+                "precipitation_probability": [],
+                "wind_bearing": [],
+                "timeofday": timeofday,
+            }
+        day = daily_data[date_key]
+        day["cloud_coverage"].append(entry.get("cloudCoverage"))
+        day["condition"].add(WEATHER_SYMBOL_DICT.get(entry.get("weatherSymbol")))
+        day["humidity"].append(entry.get("humidityRelative"))
+        day["native_dew_point"].append(entry.get("dewpoint"))
+        day["native_precipitation"].append(entry.get("prec6h", 0))
+        day["native_pressure"].append(entry.get("pressureMsl"))
+        day["native_temperature"].append(entry["tempMax6h"])
+        day["native_templow"].append(entry["tempMin6h"])
+        day["native_wind_gust_speed"].append(entry.get("windGust"))
+        day["native_wind_speed"].append(entry.get("windSpeed"))
+        day["wind_bearing"].append(entry.get("windDirection"))
+
+    def mean(values):
+        return sum(values) / len(values) if values else None
+
+    for date_key, entry in daily_data.items():
+        out["daily"].append(
+            {
+                "datetime": date_key.isoformat(),
+                "condition": max(entry["condition"], key=lambda x: list(WEATHER_SYMBOL_DICT.values()).index(x))
+                if entry["condition"]
+                else None,
+                "cloud_coverage": mean(entry["cloud_coverage"]),
+                "humidity": mean(entry["humidity"]),
+                "native_dew_point": mean(entry["native_dew_point"]),
+                "native_precipitation": sum(entry["native_precipitation"]) if entry["native_precipitation"] else 0,
+                "native_pressure": mean(entry["native_pressure"]),
+                "native_temperature": max(entry["native_temperature"]) if entry["native_temperature"] else None,
+                "native_templow": min(entry["native_templow"]) if entry["native_templow"] else None,
+                "native_wind_gust_speed": max(entry["native_wind_gust_speed"]) if entry["native_wind_gust_speed"] else None,
+                "native_wind_speed": max(entry["native_wind_speed"]) if entry["native_wind_speed"] else None,
+                "precipitation_probability": None,
+                "wind_bearing": int(mean(entry["wind_bearing"])) if entry["wind_bearing"] else None,
+            }
+        )
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--step", type=int, default=1, help="hours between forecast steps")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    payload = forecast_payload(days=args.days, step_hours=args.step)
+    entries = payload["data"]
+    assert legacy_normalize_forecasts(payload)["daily"] == helpers.forecast_daily(entries), "outputs differ"
+
+    legacy = min(timeit.repeat(lambda: legacy_normalize_forecasts(payload), number=1, repeat=args.repeat))
+    current = min(timeit.repeat(lambda: helpers.forecast_daily(entries), number=1, repeat=args.repeat))
+    print(f"{len(payload['data'])} steps over {args.days} days")
+    print(f"legacy:      {legacy * 1000:8.3f} ms")
+    print(f"single-pass: {current * 1000:8.3f} ms")
+    print(f"speedup:     {legacy / current:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
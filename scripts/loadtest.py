@@ -0,0 +1,169 @@
+"""Load test of the update path against the local stub API.
+
+Creates many coordinators in one event loop, refreshes them in rounds against
+``stub_api.StubApi`` and reports request throughput, event-loop lag, memory per
+entry and normalization time. Needs Home Assistant installed; the stub API is
+started in-process.
+
+The run fails (exit status 1) when a result crosses one of the thresholds, so
+it can be used as a regression check:
+
+    python scripts/loadtest.py --entries 500 --rounds 5 --latency 50 \
+        --max-failed 0 --max-lag-p99 250 --max-memory 256
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from stub_api import StubApi
+from payloads import current_payload, forecast_payload
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.kachelmannwetter.client import DATA_CLIENTS, KachelmannClient  # noqa: E402
+from custom_components.kachelmannwetter.const import DOMAIN  # noqa: E402
+from custom_components.kachelmannwetter.coordinator import KachelmannDataUpdateCoordinator  # noqa: E402
+from custom_components.kachelmannwetter.helpers import normalize_current, normalize_forecasts  # noqa: E402
+from custom_components.kachelmannwetter.ratelimit import RateLimiter  # noqa: E402
+
+API_KEY = "loadtest"
+
+
+class LoopLagMonitor:
+    """Measures how late a periodic sleep wakes up."""
+
+    def __init__(self, interval: float = 0.01) -> None:
+        self.interval = interval
+        self.lags: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(0.0, loop.time() - start - self.interval))
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def bench_normalization(repeat: int = 200) -> tuple[float, float]:
+    """Return mean milliseconds for normalize_current and the daily forecast."""
+    current = current_payload()
+    forecast = forecast_payload()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        normalize_current(current)
+    current_ms = (time.perf_counter() - start) * 1000 / repeat
+    start = time.perf_counter()
+    for _ in range(repeat):
+        normalize_forecasts(forecast).daily()
+    forecast_ms = (time.perf_counter() - start) * 1000 / repeat
+    return current_ms, forecast_ms
+
+
+async def run(args: argparse.Namespace) -> None:
+    stub = StubApi(latency=args.latency / 1000, rate_limited=args.rate_limited, etag=not args.no_etag)
+    runner, base_url = await stub.start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        limiter = RateLimiter(capacity=args.rate_limit, period=1)
+        client = KachelmannClient(hass, API_KEY, rate_limiter=limiter, base_url=base_url)
+        # Registered where get_client looks, so the coordinators use this client
+        hass.data.setdefault(DOMAIN, {})[DATA_CLIENTS] = {API_KEY: client}
+
+        tracemalloc.start()
+        baseline = tracemalloc.take_snapshot()
+        coordinators = [
+            # Spread entries over ``cells`` distinct locations
+            KachelmannDataUpdateCoordinator(hass, API_KEY, 47.0 + (i % args.cells) * 0.01, 8.0, 600)
+            for i in range(args.entries)
+        ]
+
+        monitor = LoopLagMonitor()
+        monitor.start()
+        durations = []
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            round_start = time.perf_counter()
+            await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+            durations.append(time.perf_counter() - round_start)
+        elapsed = time.perf_counter() - start
+        monitor.stop()
+
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        allocated = sum(stat.size_diff for stat in snapshot.compare_to(baseline, "filename"))
+        failed = sum(not coordinator.last_update_success for coordinator in coordinators)
+
+        for coordinator in coordinators:
+            await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+    await runner.cleanup()
+
+    current_ms, forecast_ms = bench_normalization()
+    throughput = args.entries * args.rounds / elapsed
+    lag_p99 = percentile(monitor.lags, 0.99) * 1000
+    memory = allocated / args.entries / 1024
+    print(f"entries:            {args.entries} at {min(args.cells, args.entries)} locations, {args.rounds} rounds")
+    print(f"stub requests:      {stub.requests} ({dict(stub.statuses)})")
+    print(f"throughput:         {stub.requests / elapsed:.1f} req/s, {throughput:.1f} refreshes/s")
+    print(f"round time:         median {statistics.median(durations) * 1000:.1f} ms, max {max(durations) * 1000:.1f} ms")
+    print(f"event-loop lag:     p50 {percentile(monitor.lags, 0.5) * 1000:.2f} ms, p99 {lag_p99:.2f} ms, max {max(monitor.lags, default=0) * 1000:.2f} ms")
+    print(f"memory per entry:   {memory:.1f} KiB")
+    print(f"normalization:      current {current_ms:.3f} ms, daily forecast {forecast_ms:.3f} ms")
+    print(f"failed entries:     {failed}")
+
+    checks = [
+        ("failed entries", failed, args.max_failed, failed > args.max_failed),
+        ("refreshes/s", throughput, args.min_throughput, args.min_throughput is not None and throughput < args.min_throughput),
+        ("event-loop lag p99 (ms)", lag_p99, args.max_lag_p99, args.max_lag_p99 is not None and lag_p99 > args.max_lag_p99),
+        ("memory per entry (KiB)", memory, args.max_memory, args.max_memory is not None and memory > args.max_memory),
+    ]
+    failures = [f"{name}: {value:.1f} (limit {limit})" for name, value, limit, failed_check in checks if failed_check]
+    if failures:
+        sys.exit("FAILED\n  " + "\n  ".join(failures))
+    print("PASSED")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=200)
+    parser.add_argument("--cells", type=int, default=200, help="distinct locations among the entries")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=20.0, help="stub latency in milliseconds")
+    parser.add_argument("--rate-limited", type=float, default=0.0, help="share of 429 responses")
+    parser.add_argument("--rate-limit", type=int, default=1_000_000, help="client token bucket, requests per second")
+    parser.add_argument("--no-etag", action="store_true")
+    parser.add_argument("--max-failed", type=int, default=0, help="fail above this many failed entries")
+    parser.add_argument("--min-throughput", type=float, help="fail below this many refreshes per second")
+    parser.add_argument("--max-lag-p99", type=float, help="fail above this p99 event-loop lag in milliseconds")
+    parser.add_argument("--max-memory", type=float, help="fail above this memory per entry in KiB")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
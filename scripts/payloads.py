@@ -0,0 +1,133 @@
+"""Synthetic KachelmannWetter payloads for benchmarks and load tests.
+
+The generated bodies follow the shape of the recorded ``/current``,
+``/forecast/{lat}/{lon}/advanced/{step}`` and ``/trend14days`` responses.
+"""
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import importlib.util
+import sys
+
+SYMBOLS = [
+    "cloudy",
+    "fog",
+    "overcast",
+    "partlycloudy",
+    "rain",
+    "raindrizzle",
+    "showers",
+    "snow",
+    "sunshine",
+    "thunderstorm",
+    "wind",
+]
+
+COMPONENT_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "kachelmannwetter"
+
+
+def load_component_module(name: str):
+    """Import a module of the integration without importing Home Assistant.
+
+    Only works for modules that do not depend on Home Assistant themselves
+    (``helpers``).
+    """
+    qualname = f"kachelmannwetter_{name}"
+    if qualname in sys.modules:
+        return sys.modules[qualname]
+    spec = importlib.util.spec_from_file_location(qualname, COMPONENT_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[qualname] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def current_payload(rng: random.Random | None = None) -> dict:
+    rng = rng or random.Random(0)
+    return {
+        "lat": 52.52,
+        "lon": 13.41,
+        "data": {
+            "temp": {"value": round(rng.uniform(-10, 30), 1), "unit": "degC"},
+            "humidityRelative": {"value": rng.randint(20, 100), "unit": "%"},
+            "pressureMsl": {"value": round(rng.uniform(980, 1040), 1), "unit": "hPa"},
+            "windSpeed": {"value": round(rng.uniform(0, 20), 1), "unit": "m/s"},
+            "windGust": {"value": round(rng.uniform(0, 30), 1), "unit": "m/s"},
+            "windDirection": {"value": rng.randint(0, 359), "unit": "deg"},
+            "prec1h": {"value": round(rng.uniform(0, 5), 1), "unit": "mm"},
+            "dewpoint": {"value": round(rng.uniform(-15, 20), 1), "unit": "degC"},
+            "weatherSymbol": {"value": rng.choice(SYMBOLS)},
+        },
+    }
+
+
+def forecast_payload(days: int = 14, step_hours: int = 6, rng: random.Random | None = None) -> dict:
+    rng = rng or random.Random(0)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    entries = []
+    for i in range(days * 24 // step_hours):
+        temp = rng.uniform(-10, 30)
+        entries.append(
+            {
+                "dateTime": (start + timedelta(hours=i * step_hours)).isoformat(),
+                "weatherSymbol": rng.choice(SYMBOLS),
+                "cloudCoverage": rng.randint(0, 100),
+                "humidityRelative": rng.randint(20, 100),
+                "dewpoint": round(temp - rng.uniform(0, 10), 1),
+                "prec6h": round(rng.uniform(0, 5), 1),
+                "pressureMsl": round(rng.uniform(980, 1040), 1),
+                "tempMax6h": round(temp + rng.uniform(0, 3), 1),
+                "tempMin6h": round(temp - rng.uniform(0, 3), 1),
+                "windGust": round(rng.uniform(0, 30), 1),
+                "windSpeed": round(rng.uniform(0, 20), 1),
+                "windDirection": rng.randint(0, 359),
+            }
+        )
+    return {"lat": 52.52, "lon": 13.41, "data": entries}
+
+
+def hourly_payload(hours: int = 72, rng: random.Random | None = None) -> dict:
+    rng = rng or random.Random(0)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    entries = []
+    for i in range(hours):
+        temp = rng.uniform(-10, 30)
+        entries.append(
+            {
+                "dateTime": (start + timedelta(hours=i)).isoformat(),
+                "weatherSymbol": rng.choice(SYMBOLS),
+                "cloudCoverage": rng.randint(0, 100),
+                "humidityRelative": rng.randint(20, 100),
+                "dewpoint": round(temp - rng.uniform(0, 10), 1),
+                "prec1h": round(rng.uniform(0, 2), 1),
+                "pressureMsl": round(rng.uniform(980, 1040), 1),
+                "temp": round(temp, 1),
+                "windGust": round(rng.uniform(0, 30), 1),
+                "windSpeed": round(rng.uniform(0, 20), 1),
+                "windDirection": rng.randint(0, 359),
+            }
+        )
+    return {"lat": 52.52, "lon": 13.41, "data": entries}
+
+
+def trend_payload(days: int = 14, rng: random.Random | None = None) -> dict:
+    rng = rng or random.Random(0)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    entries = []
+    for i in range(days):
+        temp = rng.uniform(-10, 30)
+        entries.append(
+            {
+                "dateTime": (start + timedelta(days=i)).isoformat(),
+                "weatherSymbol": rng.choice(SYMBOLS),
+                "tempMax": round(temp + rng.uniform(0, 5), 1),
+                "tempMin": round(temp - rng.uniform(0, 5), 1),
+                "prec": round(rng.uniform(0, 10), 1),
+                "precProb": rng.randint(0, 100),
+                "windSpeed": round(rng.uniform(0, 20), 1),
+                "windGust": round(rng.uniform(0, 30), 1),
+            }
+        )
+    return {"lat": 52.52, "lon": 13.41, "data": entries}
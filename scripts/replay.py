@@ -0,0 +1,126 @@
+"""Replay a recorded API session through the full update path and profile it.
+
+Recordings are written by the integration when the "record_responses" option
+is enabled (``<config>/kachelmannwetter_recordings/*.jsonl.gz``). Every
+location found in the recording gets a coordinator; each round refreshes all
+of them from the recorded responses and builds the forecast views like a
+subscribed weather entity would. Needs Home Assistant installed, no network.
+
+    python scripts/replay.py recording.jsonl.gz --rounds 10 --speed 0 --profile-dir prof/
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import re
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.kachelmannwetter.client import DATA_CLIENTS, KachelmannClient  # noqa: E402
+from custom_components.kachelmannwetter.const import DOMAIN  # noqa: E402
+from custom_components.kachelmannwetter.coordinator import KachelmannDataUpdateCoordinator  # noqa: E402
+from custom_components.kachelmannwetter.profiling import SectionProfiler  # noqa: E402
+from custom_components.kachelmannwetter.ratelimit import RateLimiter  # noqa: E402
+from custom_components.kachelmannwetter.recording import HttpReplay  # noqa: E402
+
+API_KEY = "replay"
+
+_CURRENT_RE = re.compile(r"^/current/(-?[\d.]+)/(-?[\d.]+)$")
+
+
+def locations(replay: HttpReplay) -> list[tuple[float, float]]:
+    return [
+        (float(match.group(1)), float(match.group(2)))
+        for path in replay.paths
+        if (match := _CURRENT_RE.match(path)) is not None
+    ]
+
+
+def subscribe(coordinator: KachelmannDataUpdateCoordinator) -> None:
+    """Build the forecast views on every update, as a subscribed weather entity does."""
+
+    def build_views() -> None:
+        series = coordinator.data.forecast if coordinator.data is not None else None
+        if series is not None:
+            series.daily()
+            series.twice_daily()
+            series.hourly()
+
+    coordinator.async_add_listener(build_views)
+
+
+async def run(args: argparse.Namespace) -> None:
+    replay = HttpReplay.load(args.recording, args.speed)
+    points = locations(replay)
+    if not points:
+        sys.exit(f"No /current responses in {args.recording}")
+
+    profiler = SectionProfiler(enabled=True)
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        client = KachelmannClient(hass, API_KEY, rate_limiter=RateLimiter(capacity=1_000_000, period=1), replay=replay)
+        hass.data.setdefault(DOMAIN, {})[DATA_CLIENTS] = {API_KEY: client}
+        coordinators = [
+            KachelmannDataUpdateCoordinator(hass, API_KEY, latitude, longitude, 600, profiler=profiler)
+            for latitude, longitude in points
+        ]
+        for coordinator in coordinators:
+            subscribe(coordinator)
+
+        durations = []
+        for _ in range(args.rounds):
+            if args.refetch_forecast:
+                # Take the forecast and trend path every round instead of once per model run
+                for coordinator in coordinators:
+                    coordinator._forecast_refresh_at = None
+                    coordinator._trend_fetched = None
+            started = time.perf_counter()
+            await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+            durations.append(time.perf_counter() - started)
+        failed = sum(not coordinator.last_update_success for coordinator in coordinators)
+
+        for coordinator in coordinators:
+            await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+
+    normalizations = [c.metrics.last_normalization_seconds for c in coordinators if c.metrics.normalizations]
+    print(f"recording:          {len(replay)} responses, {len(points)} locations, {args.rounds} rounds")
+    print(f"round time:         median {statistics.median(durations) * 1000:.1f} ms, max {max(durations) * 1000:.1f} ms")
+    if normalizations:
+        print(f"normalization:      median {statistics.median(normalizations) * 1000:.3f} ms (last round)")
+    print(f"failed locations:   {failed}")
+    report = profiler.as_dict(limit=args.top)
+    for name, section in report.items():
+        print(f"\n{name}: {section['calls']} calls, {section['total_seconds'] * 1000:.1f} ms")
+        for function in section["functions"]:
+            print(f"  {function['cumulative_seconds'] * 1000:9.3f} ms {function['calls']:7d}x  {function['function']}")
+    if args.profile_dir:
+        for path in profiler.dump(args.profile_dir):
+            print(f"wrote {path}")
+    if args.json:
+        Path(args.json).write_text(json.dumps({"durations": durations, "profile": report}, indent=2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", help="recorded .jsonl.gz file")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--speed", type=float, default=0.0, help="1 = recorded latency, 10 = 10x faster, 0 = none")
+    parser.add_argument("--refetch-forecast", action="store_true", help="fetch forecast and trend every round")
+    parser.add_argument("--top", type=int, default=15, help="functions listed per profiled section")
+    parser.add_argument("--profile-dir", help="write one .prof file per section to this directory")
+    parser.add_argument("--json", help="write round times and the profile summary to this file")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Local stub of the KachelmannWetter API for benchmarks and load tests.
+
+Serves synthetic ``/current``, ``/forecast/.../advanced/6h``,
+``/forecast/.../advanced/1h`` and ``/forecast/.../trend14days`` payloads with
+configurable latency, ETag revalidation (304) and a share of 429 responses.
+
+    python scripts/stub_api.py --port 8099 --latency 50 --rate-limited 0.01
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+import hashlib
+import json
+import random
+
+from aiohttp import web
+
+from payloads import current_payload, forecast_payload, hourly_payload, trend_payload
+
+
+class StubApi:
+    def __init__(
+        self,
+        latency: float = 0.0,
+        rate_limited: float = 0.0,
+        etag: bool = True,
+        max_age: int | None = None,
+        quota: int = 1_000_000,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.rate_limited = rate_limited
+        self.etag = etag
+        self.max_age = max_age
+        self.quota = quota
+        self.requests = 0
+        self.statuses: Counter[int] = Counter()
+        self._rng = random.Random(seed)
+        self._bodies = {
+            "current": self._encode(current_payload(random.Random(seed))),
+            "forecast": self._encode(forecast_payload(rng=random.Random(seed))),
+            "hourly": self._encode(hourly_payload(rng=random.Random(seed))),
+            "trend": self._encode(trend_payload(rng=random.Random(seed))),
+        }
+
+    @staticmethod
+    def _encode(payload: dict) -> tuple[bytes, str]:
+        body = json.dumps(payload).encode()
+        return body, f'"{hashlib.sha1(body).hexdigest()}"'
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/v02/current/{lat}/{lon}", self._current)
+        app.router.add_get("/v02/forecast/{lat}/{lon}/advanced/6h", self._forecast)
+        app.router.add_get("/v02/forecast/{lat}/{lon}/advanced/1h", self._hourly)
+        app.router.add_get("/v02/forecast/{lat}/{lon}/trend14days", self._trend)
+        return app
+
+    async def _current(self, request: web.Request) -> web.Response:
+        return await self._respond(request, "current")
+
+    async def _forecast(self, request: web.Request) -> web.Response:
+        return await self._respond(request, "forecast")
+
+    async def _hourly(self, request: web.Request) -> web.Response:
+        return await self._respond(request, "hourly")
+
+    async def _trend(self, request: web.Request) -> web.Response:
+        return await self._respond(request, "trend")
+
+    async def _respond(self, request: web.Request, kind: str) -> web.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        headers = {
+            "x-ratelimit-limit": str(self.quota),
+            "x-ratelimit-remaining": str(max(self.quota - self.requests, 0)),
+        }
+        if self._rng.random() < self.rate_limited:
+            self.statuses[429] += 1
+            return web.Response(status=429, headers={**headers, "Retry-After": "1"})
+        body, etag = self._bodies[kind]
+        if self.etag:
+            headers["ETag"] = etag
+            if request.headers.get("If-None-Match") == etag:
+                self.statuses[304] += 1
+                return web.Response(status=304, headers=headers)
+        if self.max_age is not None:
+            headers["Cache-Control"] = f"max-age={self.max_age}"
+        self.statuses[200] += 1
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> tuple[web.AppRunner, str]:
+        """Start serving; returns the runner and the API base URL."""
+        runner = web.AppRunner(self.app(), access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, host, port)
+        await site.start()
+        port = runner.addresses[0][1]
+        return runner, f"http://{host}:{port}/v02"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency", type=float, default=0.0, help="milliseconds added to every response")
+    parser.add_argument("--rate-limited", type=float, default=0.0, help="share of requests answered with 429")
+    parser.add_argument("--no-etag", action="store_true")
+    parser.add_argument("--max-age", type=int)
+    args = parser.parse_args()
+    stub = StubApi(args.latency / 1000, args.rate_limited, not args.no_etag, args.max_age)
+    web.run_app(stub.app(), host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()